@@ -28,6 +28,8 @@
 #
 
 import gpiozero
+import os
+import fcntl
 import time
 from smbus import SMBus
 import spidev
@@ -50,6 +52,29 @@ address = 0x14  # GT1151 touch controller I2C address
 # address = 0x48
 bus     = SMBus(1)
 
+# Raw i2c-dev handle for register reads and writes: SMBus can only read one
+# byte per transaction, and each SMBus call marshals its own ioctl struct.
+# SMBus remains the fallback when /dev/i2c-1 can't be opened directly.
+I2C_SLAVE = 0x0703
+I2C_RDWR  = 0x0707
+I2C_M_RD  = 0x0001
+
+class i2c_msg(ctypes.Structure):
+    _fields_ = [('addr', ctypes.c_uint16), ('flags', ctypes.c_uint16),
+                ('len', ctypes.c_uint16), ('buf', ctypes.POINTER(ctypes.c_uint8))]
+
+class i2c_rdwr_ioctl_data(ctypes.Structure):
+    _fields_ = [('msgs', ctypes.POINTER(i2c_msg)), ('nmsgs', ctypes.c_uint32)]
+
+i2c_fd = None
+try:
+    i2c_fd = os.open('/dev/i2c-1', os.O_RDWR)
+    fcntl.ioctl(i2c_fd, I2C_SLAVE, address)
+except OSError:
+    if i2c_fd is not None:
+        os.close(i2c_fd)
+    i2c_fd = None
+
 
 GPIO_RST_PIN    = gpiozero.LED(EPD_RST_PIN)
 GPIO_DC_PIN     = gpiozero.LED(EPD_DC_PIN)
@@ -98,13 +123,40 @@ def spi_writebyte2(data):
     spi.writebytes2(data)
 
 def i2c_writebyte(reg, value):
+    if i2c_fd is not None:
+        # Plain i2c-dev write: register high, register low, value
+        try:
+            os.write(i2c_fd, bytes(((reg>>8) & 0xff, reg & 0xff, value & 0xff)))
+            return
+        except OSError:
+            pass
     bus.write_word_data(address, (reg>>8) & 0xff, (reg & 0xff) | ((value & 0xff) << 8))
 
 def i2c_write(reg):
+    if i2c_fd is not None:
+        try:
+            os.write(i2c_fd, bytes(((reg>>8) & 0xff, reg & 0xff)))
+            return
+        except OSError:
+            pass
     bus.write_byte_data(address, (reg>>8) & 0xff, reg & 0xff)
 
+def i2c_read_combined(reg, len):
+    # Register address write and data read in one transaction (repeated start)
+    wbuf = (ctypes.c_uint8 * 2)((reg>>8) & 0xff, reg & 0xff)
+    rbuf = (ctypes.c_uint8 * len)()
+    msgs = (i2c_msg * 2)(i2c_msg(address, 0, 2, wbuf), i2c_msg(address, I2C_M_RD, len, rbuf))
+    fcntl.ioctl(i2c_fd, I2C_RDWR, i2c_rdwr_ioctl_data(msgs, 2))
+    return list(rbuf)
+
 def i2c_readbyte(reg, len):
-    i2c_write(reg)
+    if i2c_fd is not None:
+        try:
+            return i2c_read_combined(reg, len)
+        except OSError:
+            pass
+    # SMBus fallback: set the register pointer, then read byte by byte
+    bus.write_byte_data(address, (reg>>8) & 0xff, reg & 0xff)
     rbuf = []
     for i in range(len):
         rbuf.append(int(bus.read_byte(address)))
@@ -118,9 +170,13 @@ def module_init():
     return 0
 
 def module_exit():
+    global i2c_fd
     logging.debug("spi end")
     spi.close()
     bus.close()
+    if i2c_fd is not None:
+        os.close(i2c_fd)
+        i2c_fd = None
         
     logging.debug("close 5V, Module enters 0 power consumption ...")
     GPIO_RST_PIN.off()
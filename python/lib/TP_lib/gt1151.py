@@ -1,6 +1,10 @@
 import logging
+import struct
 from . import epdconfig as config
 
+# Touch point record: track id, X, Y, size (little-endian), 1 reserved byte
+POINT = struct.Struct('<BHHH')
+
 class GT_Development:
     def __init__(self):
         self.Touch = 0
@@ -53,7 +57,9 @@ class GT1151:
         
         if(GT_Dev.Touch == 1):
             GT_Dev.Touch = 0
-            buf = self.GT_Read(0x814E, 1)
+            # Status and all 5 touch points in one read, so a touch needs no
+            # second round trip for the coordinates
+            buf = self.GT_Read(0x814E, 1 + 5*8)
             
             if(buf[0]&0x80 == 0x00):
                 self.GT_Write(0x814E, mask)
@@ -67,18 +73,17 @@ class GT1151:
                     self.GT_Write(0x814E, mask)
                     return
                     
-                buf = self.GT_Read(0x814F, GT_Dev.TouchCount*8)
+                buf = buf[1:]
                 self.GT_Write(0x814E, mask)
                 
                 GT_Old.X[0] = GT_Dev.X[0];
                 GT_Old.Y[0] = GT_Dev.Y[0];
                 GT_Old.S[0] = GT_Dev.S[0];
                 
+                data = bytes(buf)
                 for i in range(0, GT_Dev.TouchCount, 1):
-                    GT_Dev.Touchkeytrackid[i] = buf[0 + 8*i] 
-                    GT_Dev.X[i] = (buf[2 + 8*i] << 8) + buf[1 + 8*i]
-                    GT_Dev.Y[i] = (buf[4 + 8*i] << 8) + buf[3 + 8*i]
-                    GT_Dev.S[i] = (buf[6 + 8*i] << 8) + buf[5 + 8*i]
+                    (GT_Dev.Touchkeytrackid[i], GT_Dev.X[i],
+                     GT_Dev.Y[i], GT_Dev.S[i]) = POINT.unpack_from(data, 8*i)
 
-                print(GT_Dev.X[0], GT_Dev.Y[0], GT_Dev.S[0])
+                logging.debug("%d %d %d", GT_Dev.X[0], GT_Dev.Y[0], GT_Dev.S[0])
                 
\ No newline at end of file
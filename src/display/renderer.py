@@ -47,6 +47,20 @@ class Renderer:
         font = self.get_font(font_size, bold)
         self.draw.text((x, y), text, font=font, fill=0, anchor=anchor)
 
+    def draw_text_batch(self, items):
+        """
+        Draw several text items, resolving each font only once.
+
+        Args:
+            items: Iterable of (text, x, y, font_size, bold, anchor) tuples
+        """
+        fonts = {}
+        for text, x, y, font_size, bold, anchor in items:
+            font = fonts.get((font_size, bold))
+            if font is None:
+                font = fonts[(font_size, bold)] = self.get_font(font_size, bold)
+            self.draw.text((x, y), text, font=font, fill=0, anchor=anchor)
+
     def draw_centered_text(self, text, y, font_size=12, bold=False):
         """Draw text centered horizontally at given y position."""
         self.draw_text(text, self.width // 2, y, font_size, bold, anchor="mt")
@@ -14,11 +14,11 @@ class Screen:
         self.title = name.replace('_', ' ').title()
 
     def update_data(self) -> bool:
-        """Update data for all widgets on this screen."""
+        """Update data for widgets on this screen that are due for an update."""
         updated = False
         for widget in self.widgets:
             try:
-                if widget.update_data():
+                if widget.needs_update() and widget.update_data():
                     updated = True
             except Exception as e:
                 print(f"Error updating {widget.get_name()} on {self.name}: {e}")
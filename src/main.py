@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Main application for the e-ink dashboard."""
+import logging
 import time
 import signal
 import sys
@@ -23,7 +24,7 @@ from src.widgets.network import NetworkWidget
 from src.widgets.clock_compact import ClockCompactWidget
 from src.widgets.weather_compact import WeatherCompactWidget
 from src.widgets.portfolio_summary import PortfolioSummaryWidget
-from src.widgets.news import NewsWidget
+from src.widgets.news import NewsWidget, stop_news_workers
 
 
 class Dashboard:
@@ -65,7 +66,7 @@ class Dashboard:
         self._init_waveshare_module()
 
         # Initialize cache
-        self.cache = APICache()
+        self.cache = APICache(durable=self.config.get('cache.durable', True))
 
         # Initialize display
         width, height = self.config.get_display_size()
@@ -386,10 +387,11 @@ class Dashboard:
             # Update current screen only
             self.screen_manager.update_current_screen()
         else:
-            # Update all widgets in single-screen mode
+            # Update all due widgets in single-screen mode
             for widget in self.widgets:
                 try:
-                    widget.update_data()
+                    if widget.needs_update():
+                        widget.update_data()
                 except Exception as e:
                     print(f"Error updating {widget.get_name()}: {e}")
 
@@ -503,8 +505,12 @@ class Dashboard:
                             print("Press Ctrl+C to exit")
                             self.last_status_print = current_time
 
-                        # Sleep in short chunks (0.05s) for responsive touch input
-                        time.sleep(min(sleep_time, 0.05))
+                        if self.touch_handler:
+                            # Returns early when the touch controller raises
+                            # its interrupt, and polls while a touch is held
+                            self.touch_handler.wait(sleep_time)
+                        else:
+                            time.sleep(min(sleep_time, 0.05))
                         continue
 
                 # Time for full refresh
@@ -540,6 +546,7 @@ class Dashboard:
         """Clean shutdown."""
         print("Shutting down dashboard...")
         self.running = False
+        stop_news_workers()
 
         # Clean up touch handler GPIO resources
         if self.touch_handler:
@@ -569,8 +576,15 @@ def main():
         action='store_true',
         help='Run once and exit (for testing)'
     )
+    parser.add_argument(
+        '--log-level',
+        type=str,
+        help='Logging level for widgets that use logging (DEBUG, INFO, WARNING)',
+        default='WARNING'
+    )
 
     args = parser.parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format='%(message)s')
 
     dashboard = Dashboard(args.config)
 
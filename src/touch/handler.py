@@ -1,31 +1,117 @@
 """Touch input handler for the e-ink display."""
+import threading
 import time
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional, Callable, Tuple
-from enum import Enum
+from enum import IntEnum
 
 
-class Gesture(Enum):
+class Gesture(IntEnum):
     """Touch gesture types."""
-    TAP = "tap"
-    SWIPE_LEFT = "swipe_left"
-    SWIPE_RIGHT = "swipe_right"
-    SWIPE_UP = "swipe_up"
-    SWIPE_DOWN = "swipe_down"
-    LONG_PRESS = "long_press"
+    TAP = 0
+    SWIPE_LEFT = 1
+    SWIPE_RIGHT = 2
+    SWIPE_UP = 3
+    SWIPE_DOWN = 4
+    LONG_PRESS = 5
 
 
 class TouchEvent:
     """Represents a touch event."""
 
+    __slots__ = ('gesture', 'position', 'timestamp')
+
     def __init__(self, gesture: Gesture, position: Tuple[int, int] = None):
         self.gesture = gesture
         self.position = position  # (x, y) coordinates
         self.timestamp = time.time()
 
     def __repr__(self):
-        return f"TouchEvent({self.gesture.value}, pos={self.position})"
+        return f"TouchEvent({self.gesture.name.lower()}, pos={self.position})"
+
+
+@lru_cache(maxsize=1)
+def _load_tp_lib():
+    """
+    Import Waveshare's TP_lib touch modules once per process.
+
+    Returns:
+        (gt1151, epdconfig) module tuple
+    """
+    repo_root = Path(__file__).parent.parent.parent
+    waveshare_lib = repo_root / "python" / "lib"
+
+    if not waveshare_lib.exists():
+        raise RuntimeError(f"Waveshare library not found at {waveshare_lib}")
+
+    # Append rather than prepend so standard library imports aren't slowed
+    if str(waveshare_lib) not in sys.path:
+        sys.path.append(str(waveshare_lib))
+
+    from TP_lib import gt1151, epdconfig
+    return gt1151, epdconfig
+
+
+# Touch sensor is portrait, 122 wide (X) by 250 tall (Y); the display is
+# landscape, 250 wide by 122 tall. Maps raw (x, y) to display coordinates
+# for each display rotation in degrees.
+_TOUCH_WIDTH = 122
+_TOUCH_HEIGHT = 250
+_ROTATION_TRANSFORMS = {
+    # 90-degree clockwise rotation: portrait to landscape
+    90: lambda x, y: (_TOUCH_HEIGHT - y, x),
+    # 270-degree clockwise (or 90 counter-clockwise)
+    270: lambda x, y: (y, _TOUCH_WIDTH - x),
+    # 180-degree rotation
+    180: lambda x, y: (_TOUCH_HEIGHT - y, _TOUCH_WIDTH - x),
+}
+
+
+# Device-tree clock of the I2C bus the touch controller is on (big-endian u32)
+_I2C_CLOCK_FILE = Path('/sys/class/i2c-adapter/i2c-1/of_node/clock-frequency')
+_I2C_FAST_MODE_HZ = 400000  # GT1151 supports I2C fast mode
+
+
+def _i2c_clock_hz() -> Optional[int]:
+    """Configured I2C bus clock in Hz, or None if it can't be read."""
+    try:
+        return int.from_bytes(_I2C_CLOCK_FILE.read_bytes()[:4], 'big') or None
+    except OSError:
+        return None
+
+
+def _classify_gesture(dx: int, dy: int, duration: float,
+                      swipe_threshold: int, long_press_duration: float) -> Gesture:
+    """
+    Classify a completed touch from its raw displacement and duration.
+
+    Args:
+        dx, dy: End position minus start position in pixels
+        duration: Touch duration in seconds
+        swipe_threshold: Minimum displacement for a swipe
+        long_press_duration: Minimum duration for a long press
+
+    Returns:
+        Detected gesture type
+    """
+    # Long press detection
+    if duration > long_press_duration:
+        return Gesture.LONG_PRESS
+
+    # Swipe detection
+    adx = dx if dx >= 0 else -dx
+    ady = dy if dy >= 0 else -dy
+    if adx > swipe_threshold or ady > swipe_threshold:
+        # Horizontal swipe
+        if adx > ady:
+            return Gesture.SWIPE_LEFT if dx < 0 else Gesture.SWIPE_RIGHT
+        # Vertical swipe
+        return Gesture.SWIPE_UP if dy < 0 else Gesture.SWIPE_DOWN
+
+    # Anything else (short touch with minimal movement) is a tap
+    return Gesture.TAP
 
 
 class TouchHandler:
@@ -47,16 +133,35 @@ class TouchHandler:
         self.swipe_threshold = 30  # Minimum pixels for swipe
         self.long_press_duration = 2.0  # Seconds for long press
         self.tap_timeout = 0.5  # Maximum duration for tap
+        self.touch_slop = 8  # Pixels a touch may wander and still count as stationary
+
+        # wait() timing: poll at poll_interval while a touch is in progress
+        # (releases don't raise an interrupt), otherwise sleep up to
+        # idle_wait unless the controller's INT line wakes us first
+        self.poll_interval = 0.05
+        self.idle_wait = 1.0
+        self._next_poll = 0.0  # Monotonic deadline of the next held-touch poll
+
+        # Minimum seconds between GT1151 reads; INT edges closer together
+        # than this are bounce and are not worth an I2C round trip
+        self.scan_interval = 0.02
+        self._last_scan = 0.0
+        self._int_event: Optional[threading.Event] = None
 
         # Touch state
         self.touch_start = None
         self.touch_start_time = None
         self.touch_current = None
         self._long_press_fired = False
+        self._left_slop = False  # True once the touch has moved beyond touch_slop
 
         # Callbacks
         self.on_gesture: Optional[Callable[[TouchEvent], None]] = None
 
+        # GT1151 driver and its INT pin reader, set once hardware is up
+        self.gt = None
+        self._read_int: Optional[Callable[[], int]] = None
+
         try:
             # Try to initialize touch hardware
             self._init_touch_hardware()
@@ -72,17 +177,8 @@ class TouchHandler:
         This uses the working library from python/lib/TP_lib instead of
         reimplementing the touch detection.
         """
-        # Add Waveshare's library to Python path
-        repo_root = Path(__file__).parent.parent.parent
-        waveshare_lib = repo_root / "python" / "lib"
-
-        if not waveshare_lib.exists():
-            raise RuntimeError(f"Waveshare library not found at {waveshare_lib}")
-
-        sys.path.insert(0, str(waveshare_lib))
-
         try:
-            from TP_lib import gt1151, epdconfig
+            gt1151, epdconfig = _load_tp_lib()
 
             # Only initialize module if not already done
             if self.epdconfig is None:
@@ -102,6 +198,21 @@ class TouchHandler:
 
             # Initialize the touch controller (reset + version read)
             self.gt.GT_Init()
+            self._read_int = partial(epdconfig.digital_read, self.gt.INT)
+
+            # Touch reports are I2C-bound; the Pi defaults to 100 kHz
+            clock = _i2c_clock_hz()
+            if clock:
+                print(f"  I2C bus clock: {clock // 1000} kHz")
+                if clock < _I2C_FAST_MODE_HZ:
+                    print("  Hint: add 'dtparam=i2c_arm_baudrate=400000' to "
+                          "/boot/firmware/config.txt for faster touch reads")
+
+            # Wake wait() on INT falling edges; gpiozero delivers these from
+            # the pin factory's kernel edge events, not by polling.
+            # INT is an active-high Button, so falling means "released".
+            self._int_event = threading.Event()
+            epdconfig.GPIO_INT.when_released = lambda: self._int_event.set()
 
             print("✓ Touch hardware initialized (Waveshare GT1151)")
 
@@ -123,35 +234,38 @@ class TouchHandler:
         Returns:
             (x, y) tuple in display coordinates
         """
-        if self.rotation == 90:
-            # 90-degree clockwise rotation: portrait to landscape
-            # Touch sensor: 122 wide (X), 250 tall (Y)
-            # Display: 250 wide (X), 122 tall (Y)
-            touch_height = 250
-            new_x = touch_height - y
-            new_y = x
-            return (new_x, new_y)
-        elif self.rotation == 270:
-            # 270-degree clockwise (or 90 counter-clockwise)
-            touch_width = 122
-            new_x = y
-            new_y = touch_width - x
-            return (new_x, new_y)
-        elif self.rotation == 180:
-            # 180-degree rotation
-            touch_width = 122
-            touch_height = 250
-            new_x = touch_height - y
-            new_y = touch_width - x
-            return (new_x, new_y)
-        else:
+        transform = _ROTATION_TRANSFORMS.get(self.rotation)
+        if transform is None:
             # No rotation (0 degrees)
             return (x, y)
+        return transform(x, y)
 
     def set_gesture_callback(self, callback: Callable[[TouchEvent], None]):
         """Set callback function for gesture events."""
         self.on_gesture = callback
 
+    def wait(self, timeout: float) -> None:
+        """
+        Sleep until the touch controller signals a touch, or timeout.
+
+        Args:
+            timeout: Longest time to wait in seconds; capped at idle_wait,
+                or at poll_interval while a touch needs polling
+        """
+        event = self._int_event
+        if event is None or self.touch_start is not None:
+            # Fixed-rate deadlines, so time spent on I2C reads and gesture
+            # handling doesn't stretch the polling period
+            now = time.monotonic()
+            self._next_poll += self.poll_interval
+            if self._next_poll < now:
+                # Fell behind, or polling just started: restart the cadence
+                self._next_poll = now + self.poll_interval
+            time.sleep(max(0.0, min(timeout, self._next_poll - now)))
+            return
+        event.wait(max(0.0, min(timeout, self.idle_wait)))
+        event.clear()
+
     def poll(self) -> Optional[TouchEvent]:
         """
         Poll for touch events from hardware using Waveshare's GT1151 library.
@@ -164,24 +278,32 @@ class TouchHandler:
 
         try:
             # Use Waveshare's GT1151 library
-            if hasattr(self, 'gt'):
-                # Check INT pin state
-                int_state = self.epdconfig.digital_read(self.gt.INT)
+            gt = self.gt
+            if gt is not None:
+                dev = self.GT_Dev
 
-                if int_state == 0:  # INT LOW = touch detected
-                    self.GT_Dev.Touch = 1
+                # Check INT pin state
+                if self._read_int() == 0:  # INT LOW = touch detected
+                    now = time.monotonic()
+                    if now - self._last_scan < self.scan_interval:
+                        return None
+                    self._last_scan = now
+                    dev.Touch = 1
                 else:
-                    self.GT_Dev.Touch = 0
+                    dev.Touch = 0
                     # Manually clear TouchpointFlag (GT_Scan doesn't clear it when Touch == 0)
-                    self.GT_Dev.TouchpointFlag = 0
+                    dev.TouchpointFlag = 0
+                    if self.touch_start is None:
+                        # Idle: no interrupt to service and no touch to finish
+                        return None
 
                 # Scan for touch data
-                self.gt.GT_Scan(self.GT_Dev, self.GT_Old)
+                gt.GT_Scan(dev, self.GT_Old)
 
                 # Check if touch is currently active (based on TouchpointFlag, not position)
-                if self.GT_Dev.TouchpointFlag:
+                if dev.TouchpointFlag:
                     # Touch is active - get raw coordinates
-                    raw_x, raw_y = self.GT_Dev.X[0], self.GT_Dev.Y[0]
+                    raw_x, raw_y = dev.X[0], dev.Y[0]
 
                     # Filter out spurious (0,0) touches
                     if raw_x == 0 and raw_y == 0:
@@ -195,15 +317,22 @@ class TouchHandler:
                         self.touch_start = (x, y)
                         self.touch_start_time = time.time()
                         self.touch_current = (x, y)
-                    else:
-                        # Touch continuing - update current position
+                    elif self._left_slop:
+                        # Touch is moving - track current position
                         self.touch_current = (x, y)
-
-                        # Check for long press
-                        duration = time.time() - self.touch_start_time
-                        if duration > self.long_press_duration and not self._long_press_fired:
-                            self._long_press_fired = True
-                            return TouchEvent(Gesture.LONG_PRESS, self.touch_start)
+                    else:
+                        # Ignore jitter within the slop region so a still finger
+                        # stays a tap/long press anchored at the start position
+                        start_x, start_y = self.touch_start
+                        if abs(x - start_x) >= self.touch_slop or abs(y - start_y) >= self.touch_slop:
+                            self._left_slop = True
+                            self.touch_current = (x, y)
+                        elif not self._long_press_fired:
+                            # Check for long press
+                            duration = time.time() - self.touch_start_time
+                            if duration > self.long_press_duration:
+                                self._long_press_fired = True
+                                return TouchEvent(Gesture.LONG_PRESS, self.touch_start)
                 else:
                     # Touch not active - check if it was just released
                     if self.touch_start is not None:
@@ -223,6 +352,7 @@ class TouchHandler:
                         self.touch_start_time = None
                         self.touch_current = None
                         self._long_press_fired = False
+                        self._left_slop = False
 
                         return event
 
@@ -259,31 +389,13 @@ class TouchHandler:
         Returns:
             Detected gesture type
         """
-        x1, y1 = start_pos
-        x2, y2 = end_pos
-
-        dx = x2 - x1
-        dy = y2 - y1
-
-        # Long press detection
-        if duration > self.long_press_duration:
-            return Gesture.LONG_PRESS
-
-        # Swipe detection
-        if abs(dx) > self.swipe_threshold or abs(dy) > self.swipe_threshold:
-            # Horizontal swipe
-            if abs(dx) > abs(dy):
-                return Gesture.SWIPE_LEFT if dx < 0 else Gesture.SWIPE_RIGHT
-            # Vertical swipe
-            else:
-                return Gesture.SWIPE_UP if dy < 0 else Gesture.SWIPE_DOWN
-
-        # Tap (short touch with minimal movement)
-        if duration < self.tap_timeout:
-            return Gesture.TAP
-
-        # Default to tap
-        return Gesture.TAP
+        return _classify_gesture(
+            end_pos[0] - start_pos[0],
+            end_pos[1] - start_pos[1],
+            duration,
+            self.swipe_threshold,
+            self.long_press_duration
+        )
 
     def get_touch_zones(self, num_zones: int = 3) -> list:
         """
@@ -1,26 +1,56 @@
 """API caching and rate limiting utilities."""
+import logging
+import os
 import time
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable, Any
 
+log = logging.getLogger(__name__)
+
+# Characters in cache keys that are not safe in filenames
+_KEY_TRANS = str.maketrans('/:', '__')
+
+
+@lru_cache(maxsize=256)
+def _sanitize_key(key: str) -> str:
+    """Map a cache key to a filesystem-safe name."""
+    return key.translate(_KEY_TRANS)
+
 
 class APICache:
     """Simple file-based cache for API responses with TTL."""
 
-    def __init__(self, cache_dir=None):
+    def __init__(self, cache_dir=None, durable=True):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: <project>/.cache)
+            durable: fsync cache files before replacing them, so a power
+                loss cannot leave an empty entry behind
+        """
+        self.durable = durable
+
         if cache_dir is None:
             project_root = Path(__file__).parent.parent.parent
             cache_dir = project_root / ".cache"
 
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+        if not self.cache_dir.is_dir():
+            self.cache_dir.mkdir(exist_ok=True)
+
+        # Resolved cache file paths by key
+        self._cache_files = {}
 
     def get_cache_file(self, key: str) -> Path:
         """Get path to cache file for given key."""
-        # Simple sanitization of key for filename
-        safe_key = key.replace('/', '_').replace(':', '_')
-        return self.cache_dir / f"{safe_key}.json"
+        cache_file = self._cache_files.get(key)
+        if cache_file is None:
+            cache_file = self.cache_dir / f"{_sanitize_key(key)}.json"
+            self._cache_files[key] = cache_file
+        return cache_file
 
     def get(self, key: str, ttl_seconds: int, fetch_func: Callable[[], Any]) -> Any:
         """
@@ -53,14 +83,55 @@ class APICache:
         fresh_data = fetch_func()
 
         # Store in cache
-        with open(cache_file, 'w') as f:
-            json.dump({
-                'timestamp': time.time(),
-                'data': fresh_data
-            }, f)
+        self.store(key, fresh_data)
 
         return fresh_data
 
+    def load(self, key: str, max_age: Optional[float] = None) -> Any:
+        """
+        Return the last stored data for key, or None.
+
+        Without max_age the entry is returned regardless of age, which is
+        useful for showing stale data at startup while a refresh runs.
+
+        Args:
+            key: Unique cache key
+            max_age: Treat entries older than this many seconds as missing
+        """
+        cache_file = self.get_cache_file(key)
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if max_age is not None and time.time() - cached['timestamp'] >= max_age:
+                return None
+            return cached['data']
+        except (OSError, json.JSONDecodeError, KeyError):
+            return None
+
+    def store(self, key: str, data: Any):
+        """Store data for key, stamped with the current time."""
+        self._write(self.get_cache_file(key), {
+            'timestamp': time.time(),
+            'data': data
+        })
+
+    def _write(self, cache_file: Path, payload: dict):
+        """Atomically write a cache file via a temporary file and rename."""
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(payload, f)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            log.warning("Error writing cache file %s: %s", cache_file, e)
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
     def clear(self, key: Optional[str] = None):
         """Clear cache for specific key or all cache."""
         if key:
@@ -1,6 +1,85 @@
 """Geocoding utilities for converting ZIP codes to coordinates."""
+import json
+import logging
+import os
+import re
+import threading
+import time
 import requests
-from typing import Optional, Tuple
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple
+from urllib3.util.retry import Retry
+
+log = logging.getLogger(__name__)
+
+# Exactly five ASCII digits (\Z so a trailing newline is not accepted)
+_ZIP_MATCH = re.compile(r'[0-9]{5}\Z').match
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session that retries transient Nominatim errors."""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'RaspberryPi-EInk-Dashboard/1.0'
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+    return session
+
+
+# Shared across lookups so repeat calls reuse the TCP/TLS connection
+_SESSION = _create_session()
+
+# Successful lookups by ZIP: (timestamp, (lat, lon, location_name)).
+# ZIP -> location mappings are stable, so entries live for 30 days.
+_GEOCODE_TTL_SECONDS = 30 * 24 * 3600
+_GEOCODE_CACHE_MAX = 1024
+_geocode_cache: Dict[str, Tuple[float, Tuple[float, float, str]]] = {}
+
+# The cache is persisted next to the API cache so restarts don't repeat lookups
+_GEOCODE_CACHE_FILE = Path(__file__).parent.parent.parent / ".cache" / "geocode_cache.json"
+_geocode_cache_loaded = False
+_geocode_cache_lock = threading.Lock()
+
+# Serializes network lookups, so widgets geocoding the same ZIP at startup
+# make one request and the others read the result from the cache. This also
+# keeps us within Nominatim's one-request-per-second policy
+_lookup_lock = threading.Lock()
+
+
+def _load_geocode_cache():
+    """Fill the in-memory cache from disk on first use."""
+    global _geocode_cache_loaded
+    with _geocode_cache_lock:
+        if _geocode_cache_loaded:
+            return
+        _geocode_cache_loaded = True
+        try:
+            with open(_GEOCODE_CACHE_FILE, 'r') as f:
+                entries = json.load(f)
+            now = time.time()
+            for zip_code, (timestamp, (lat, lon, name)) in entries.items():
+                if now - timestamp < _GEOCODE_TTL_SECONDS:
+                    _geocode_cache.setdefault(zip_code, (timestamp, (lat, lon, name)))
+        except (OSError, ValueError, TypeError, AttributeError):
+            # Missing or unreadable file; lookups repopulate it
+            pass
+
+
+def _save_geocode_cache():
+    """Atomically write the in-memory cache to disk."""
+    tmp_file = _GEOCODE_CACHE_FILE.with_name(_GEOCODE_CACHE_FILE.name + '.tmp')
+    try:
+        _GEOCODE_CACHE_FILE.parent.mkdir(exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump(_geocode_cache, f)
+        os.replace(tmp_file, _GEOCODE_CACHE_FILE)
+    except OSError as e:
+        log.warning("Error writing geocode cache: %s", e)
 
 
 class Geocoder:
@@ -17,6 +96,32 @@ class Geocoder:
         Returns:
             Tuple of (latitude, longitude, city_name) or None if lookup fails
         """
+        zip_code = zip_code.strip()
+
+        if not _geocode_cache_loaded:
+            _load_geocode_cache()
+        cached = Geocoder._cached(zip_code)
+        if cached is not None:
+            return cached
+
+        with _lookup_lock:
+            # Another caller may have looked this ZIP up while we waited
+            cached = Geocoder._cached(zip_code)
+            if cached is not None:
+                return cached
+            return Geocoder._lookup(zip_code)
+
+    @staticmethod
+    def _cached(zip_code: str) -> Optional[Tuple[float, float, str]]:
+        """Return an unexpired cached lookup for zip_code, or None."""
+        cached = _geocode_cache.get(zip_code)
+        if cached is not None and time.time() - cached[0] < _GEOCODE_TTL_SECONDS:
+            return cached[1]
+        return None
+
+    @staticmethod
+    def _lookup(zip_code: str) -> Optional[Tuple[float, float, str]]:
+        """Query Nominatim for zip_code and cache a successful result."""
         try:
             # Use OpenStreetMap Nominatim (free, no API key)
             # Rate limit: 1 request/second
@@ -27,11 +132,8 @@ class Geocoder:
                 'format': 'json',
                 'limit': 1
             }
-            headers = {
-                'User-Agent': 'RaspberryPi-EInk-Dashboard/1.0'
-            }
 
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = _SESSION.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
@@ -51,16 +153,27 @@ class Geocoder:
                 else:
                     location_name = display_parts[0].strip() if display_parts else f"ZIP {zip_code}"
 
-                print(f"Geocoded {zip_code} -> {lat}, {lon} ({location_name})")
+                log.info("Geocoded %s -> %s, %s (%s)", zip_code, lat, lon, location_name)
+                Geocoder._remember(zip_code, (lat, lon, location_name))
                 return lat, lon, location_name
 
-            print(f"No results for ZIP code: {zip_code}")
+            log.warning("No results for ZIP code: %s", zip_code)
             return None
 
         except Exception as e:
-            print(f"Error geocoding ZIP {zip_code}: {e}")
+            log.warning("Error geocoding ZIP %s: %s", zip_code, e)
             return None
 
+    @staticmethod
+    def _remember(zip_code: str, result: Tuple[float, float, str]):
+        """Cache a successful lookup, evicting the oldest entry when full."""
+        with _geocode_cache_lock:
+            _geocode_cache.pop(zip_code, None)
+            if len(_geocode_cache) >= _GEOCODE_CACHE_MAX:
+                del _geocode_cache[next(iter(_geocode_cache))]
+            _geocode_cache[zip_code] = (time.time(), result)
+            _save_geocode_cache()
+
     @staticmethod
     def validate_zip(zip_code: str) -> bool:
         """
@@ -75,12 +188,5 @@ class Geocoder:
         if not zip_code:
             return False
 
-        # Remove any whitespace
-        zip_code = zip_code.strip()
-
-        # Must be exactly 5 digits
-        if len(zip_code) != 5:
-            return False
-
-        # Must be all digits
-        return zip_code.isdigit()
+        # Must be exactly 5 digits (ignoring surrounding whitespace)
+        return _ZIP_MATCH(zip_code.strip()) is not None
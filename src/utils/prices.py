@@ -0,0 +1,230 @@
+"""Stock and cryptocurrency price lookups shared by the portfolio widgets."""
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib3.util.retry import Retry
+
+# orjson parses API payloads several times faster when it's installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+log = logging.getLogger(__name__)
+
+# Seconds a cached per-symbol price stays fresh (stock data updates frequently)
+PRICE_TTL = 300
+
+# CoinGecko free API (no key) and Finnhub quote endpoints
+_COINGECKO_URL = "https://api.coingecko.com/api/v3/simple/price"
+_FINNHUB_URL = "https://finnhub.io/api/v1/quote"
+
+# Map common symbols to CoinGecko IDs
+_COIN_MAP = {
+    'BTC': 'bitcoin',
+    'ETH': 'ethereum',
+    'USDT': 'tether',
+    'BNB': 'binancecoin',
+    'SOL': 'solana',
+    'ADA': 'cardano',
+    'DOGE': 'dogecoin',
+    'XRP': 'ripple',
+    'DOT': 'polkadot',
+    'MATIC': 'matic-network',
+    'AVAX': 'avalanche-2',
+    'LINK': 'chainlink',
+    'UNI': 'uniswap',
+    'ATOM': 'cosmos',
+    'LTC': 'litecoin',
+}
+
+# Tickers treated as crypto even without a -USD suffix
+_CRYPTO_KEYWORDS = frozenset(_COIN_MAP)
+
+# Concurrent Finnhub lookups per fetch_many() call
+_MAX_WORKERS = 8
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session sized for concurrent quote lookups."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+    session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+# Shared by every PriceFetcher so all widgets reuse one connection pool
+_SESSION = _create_session()
+
+
+@lru_cache(maxsize=256)
+def is_crypto_symbol(symbol: str) -> bool:
+    """Check if symbol looks like a crypto ticker."""
+    # Common crypto patterns: BTC-USD, ETH-USD, or just BTC, ETH, etc.
+    symbol = symbol.upper()
+    return symbol.split('-')[0] in _CRYPTO_KEYWORDS or symbol.endswith('-USD')
+
+
+class PriceFetcher:
+    """Fetch (price, change_pct) quotes, cached per symbol in an APICache."""
+
+    def __init__(self, finnhub_api_key: str = '', cache=None):
+        """
+        Initialize fetcher.
+
+        Args:
+            finnhub_api_key: API key for stock quotes (crypto needs none)
+            cache: Optional APICache; entries are shared across widgets
+        """
+        self.finnhub_api_key = finnhub_api_key
+        self.cache = cache
+        self.session = _SESSION
+
+        # (ETag, Last-Modified) of the last Finnhub quote per symbol, used to
+        # revalidate stale cached prices with a conditional GET
+        self._validators = {}
+
+    def fetch_many(self, symbols: Iterable[str]) -> Dict[str, Tuple[float, float]]:
+        """
+        Get (price, change_pct) for each symbol.
+
+        Fresh cached prices are used as-is. Remaining crypto symbols are
+        fetched in a single CoinGecko request, and stocks concurrently from
+        Finnhub (which has no batch quote endpoint).
+
+        Returns:
+            Quotes by symbol; symbols that could not be priced are omitted
+        """
+        quotes = {}
+        pending = []
+        for symbol in symbols:
+            cached = self._cached_price(symbol)
+            if cached:
+                quotes[symbol] = tuple(cached)
+            else:
+                pending.append(symbol)
+
+        if not pending:
+            return quotes
+
+        crypto = [s for s in pending if is_crypto_symbol(s)]
+        stocks = [s for s in pending if not is_crypto_symbol(s)]
+
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(stocks) + 1)) as executor:
+            crypto_future = executor.submit(self._fetch_crypto_prices, crypto) if crypto else None
+            for symbol, quote in zip(stocks, executor.map(self._fetch_stock_price, stocks)):
+                if quote:
+                    fetched[symbol] = quote
+            if crypto_future:
+                fetched.update(crypto_future.result())
+
+        for symbol, (price, change_pct) in fetched.items():
+            self._store_price(symbol, price, change_pct)
+        quotes.update(fetched)
+        return quotes
+
+    def _cached_price(self, symbol: str) -> Optional[list]:
+        """Return a fresh cached [price, change_pct] for symbol, or None."""
+        if self.cache is None:
+            return None
+        return self.cache.load(f"price_{symbol.upper()}", max_age=PRICE_TTL)
+
+    def _store_price(self, symbol: str, price: float, change_pct: float):
+        """Cache a freshly fetched price for symbol."""
+        if self.cache is not None:
+            self.cache.store(f"price_{symbol.upper()}", [price, change_pct])
+
+    def _fetch_crypto_prices(self, symbols: List[str]) -> Dict[str, Tuple[float, float]]:
+        """Fetch crypto prices from CoinGecko in one request."""
+        # Parse symbols (e.g., BTC-USD -> bitcoin)
+        coin_ids = {}
+        for symbol in symbols:
+            coin_id = _COIN_MAP.get(symbol.split('-')[0].upper())
+            if coin_id:
+                coin_ids[symbol] = coin_id
+            else:
+                log.warning("Unknown crypto symbol: %s", symbol)
+        if not coin_ids:
+            return {}
+
+        try:
+            params = {
+                'ids': ','.join(sorted(set(coin_ids.values()))),
+                'vs_currencies': 'usd',
+                'include_24hr_change': 'true'
+            }
+
+            response = self.session.get(_COINGECKO_URL, params=params, timeout=10)
+            response.raise_for_status()
+            data = _loads(response.content)
+
+        except Exception as e:
+            log.warning("Error fetching crypto %s: %s", ', '.join(coin_ids), e)
+            return {}
+
+        quotes = {}
+        for symbol, coin_id in coin_ids.items():
+            if coin_id in data:
+                price = data[coin_id]['usd']
+                change_pct = data[coin_id].get('usd_24h_change', 0.0)
+                quotes[symbol] = (price, change_pct)
+        return quotes
+
+    def _fetch_stock_price(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """Fetch stock price using Finnhub API."""
+        if not self.finnhub_api_key:
+            log.warning("No Finnhub API key configured for %s", symbol)
+            return None
+
+        try:
+            params = {
+                'symbol': symbol.upper(),
+                'token': self.finnhub_api_key
+            }
+
+            etag, last_modified = self._validators.get(symbol, (None, None))
+            stale = None
+            if self.cache is not None and (etag or last_modified):
+                stale = self.cache.load(f"price_{symbol.upper()}")
+            headers = {}
+            if stale:
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+            response = self.session.get(_FINNHUB_URL, params=params, headers=headers, timeout=10)
+            if response.status_code == 304 and headers:
+                # Quote unchanged; re-storing the cached price renews its TTL
+                return tuple(stale)
+            response.raise_for_status()
+            data = _loads(response.content)
+            self._validators[symbol] = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+            )
+
+            # Finnhub returns: c (current), d (change), dp (percent change),
+            # h (high), l (low), o (open), pc (previous close)
+            current_price = data.get('c', 0)
+            change_pct = data.get('dp', 0)  # dp is percent change
+
+            # Check if we got valid data (Finnhub returns 0 for invalid symbols)
+            if current_price == 0:
+                log.warning("No data returned for %s", symbol)
+                return None
+
+            return (current_price, change_pct)
+
+        except Exception as e:
+            log.warning("Error fetching stock %s: %s", symbol, e)
+            return None
@@ -0,0 +1,204 @@
+"""Open-Meteo forecast client shared by the weather widgets."""
+import logging
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple
+from urllib3.util.retry import Retry
+
+# orjson parses API payloads several times faster when it's installed
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+log = logging.getLogger(__name__)
+
+_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# (connect, read) timeouts: fail fast when the host is unreachable, but
+# give a slow response time to arrive
+_TIMEOUT = (3.05, 10)
+
+# Seconds a cached forecast is served before it is refetched
+FORECAST_TTL = 600
+
+# Older entries up to this age are still served while a background refresh
+# runs; past it (e.g. after a long power-off) the fetch happens inline
+FORECAST_STALE_TTL = 3600
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session that retries transient Open-Meteo errors."""
+    session = requests.Session()
+    # 4xx (e.g. bad coordinates) is not retried, only timeouts, rate limits,
+    # server errors and connection failures
+    retry_options = dict(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[408, 429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True
+    )
+    try:
+        # Cap each wait at 8s and add jitter (urllib3 2.x only)
+        retry = Retry(backoff_max=8, backoff_jitter=0.5, **retry_options)
+    except TypeError:
+        retry = Retry(**retry_options)
+    session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+    return session
+
+
+# Shared across refreshes and widgets so each fetch reuses the TCP/TLS connection
+_SESSION = _create_session()
+
+# Runs the weather widgets' first fetch so neither constructing nor rendering
+# a widget waits on the network (threads are only started on first use)
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='weather')
+
+# Serializes cache access, so widgets asking for the same forecast at once
+# make one request and the others read it from the cache
+_fetch_lock = threading.Lock()
+
+# Cache keys with a background refresh in flight
+_refreshing = set()
+
+# (ETag, Last-Modified) of the last response per cache key, used to
+# revalidate stale entries with a conditional GET
+_validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+
+def _temperature_unit(units: str) -> str:
+    """Open-Meteo temperature_unit for a configured units value."""
+    return 'fahrenheit' if units == 'fahrenheit' else 'celsius'
+
+
+def forecast_cache_key(latitude: float, longitude: float, units: str, days: int) -> str:
+    """
+    APICache key for a forecast request.
+
+    Coordinates are rounded so widgets configured with slightly different
+    floats for the same place share one entry.
+    """
+    return f"weather_{latitude:.3f}_{longitude:.3f}_{_temperature_unit(units)}_{days}"
+
+
+def fetch_forecast(latitude: float, longitude: float, units: str, days: int,
+                   cache=None) -> Optional[dict]:
+    """
+    Get the current conditions and daily forecast for a location.
+
+    Args:
+        latitude, longitude: Location
+        units: 'fahrenheit' or 'celsius'
+        days: Forecast days to request, including today
+        cache: Optional APICache; entries are fresh for FORECAST_TTL seconds,
+            then served stale (up to FORECAST_STALE_TTL) while a background
+            refresh replaces them
+
+    Returns:
+        Open-Meteo response payload, or None if the fetch failed
+    """
+    key = forecast_cache_key(latitude, longitude, units, days)
+    if cache is None:
+        return _request(latitude, longitude, units, days, key, None)
+
+    with _fetch_lock:
+        data = cache.load(key, max_age=FORECAST_TTL)
+        if data is not None:
+            return data
+
+        stale = cache.load(key, max_age=FORECAST_STALE_TTL)
+        if stale is None:
+            # Nothing recent enough to show; fetch now
+            data = _request(latitude, longitude, units, days, key, cache)
+            if data is not None:
+                cache.store(key, data)
+            return data
+
+        if key not in _refreshing:
+            _refreshing.add(key)
+            FETCH_EXECUTOR.submit(_refresh, latitude, longitude, units, days, key, cache)
+        return stale
+
+
+def _refresh(latitude: float, longitude: float, units: str, days: int, key: str, cache):
+    """Replace a stale cache entry (background worker)."""
+    try:
+        data = _request(latitude, longitude, units, days, key, cache)
+        if data is not None:
+            with _fetch_lock:
+                cache.store(key, data)
+    finally:
+        with _fetch_lock:
+            _refreshing.discard(key)
+
+
+def _trim(payload: dict) -> dict:
+    """
+    Keep only the fields the weather widgets read.
+
+    Units, timezone and grid metadata are dropped so the cached entry (and
+    every reload of it) stays small.
+    """
+    current = payload['current']
+    daily = payload['daily']
+    return {
+        'current': {
+            'temperature_2m': current['temperature_2m'],
+            'weather_code': current['weather_code'],
+        },
+        'daily': {
+            'time': daily['time'],
+            'temperature_2m_max': daily['temperature_2m_max'],
+            'temperature_2m_min': daily['temperature_2m_min'],
+            'weather_code': daily['weather_code'],
+        },
+    }
+
+
+def _request(latitude: float, longitude: float, units: str, days: int,
+             key: str, cache) -> Optional[dict]:
+    """Fetch a forecast from Open-Meteo (the session retries transient errors)."""
+    params = {
+        'latitude': latitude,
+        'longitude': longitude,
+        'current': ['temperature_2m', 'weather_code'],
+        'daily': ['temperature_2m_max', 'temperature_2m_min', 'weather_code'],
+        'temperature_unit': _temperature_unit(units),
+        'timezone': 'auto',
+        'forecast_days': days
+    }
+
+    try:
+        # Revalidate the stale cache entry when the server gave us
+        # validators for it; a 304 carries no body to parse
+        etag, last_modified = _validators.get(key, (None, None))
+        stale = None
+        if cache is not None and (etag or last_modified):
+            stale = cache.load(key)
+        headers = {}
+        if stale is not None:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = _SESSION.get(_FORECAST_URL, params=params, headers=headers, timeout=_TIMEOUT)
+        if response.status_code == 304 and headers:
+            log.info("✓ Weather unchanged since last fetch")
+            return stale
+        response.raise_for_status()
+        data = _trim(_loads(response.content))
+        _validators[key] = (
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+        )
+        return data
+
+    except requests.exceptions.RequestException as e:
+        log.warning("✗ Weather fetch failed: %s", e)
+    except (ValueError, KeyError, TypeError) as e:
+        log.warning("✗ Invalid weather response: %s", e)
+    return None
@@ -1,91 +1,341 @@
 #!/usr/bin/env python3
 """Web dashboard for managing e-ink display settings."""
-from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask import Flask, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+import copy
+import threading
 import yaml
 import os
 from pathlib import Path
 
+try:
+    # libyaml-backed parser/emitter (much faster than the pure-Python ones)
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent to path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.utils.geocoding import Geocoder
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson."""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
 
+# Use orjson for jsonify() and request parsing when it's installed
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Get project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 CONFIG_FILE = PROJECT_ROOT / "config" / "config.yaml"
 
 
-def load_config():
-    """Load configuration from YAML file."""
-    with open(CONFIG_FILE, 'r') as f:
-        return yaml.safe_load(f)
+class APIError(Exception):
+    """Error returned to the client as a JSON error response."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+class ConfigStore:
+    """
+    Cached config.yaml with serialized read-modify-write.
+
+    The parsed file is kept in memory and only re-read when its mtime or
+    size changes. Mutations run under a lock against a private copy and
+    are written back atomically, so concurrent requests can't lose each
+    other's updates.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._config = None
+        self._stat = None
+
+    def _stat_key(self):
+        """Get the (mtime, size) key used to validate the cache."""
+        st = self.path.stat()
+        return (st.st_mtime_ns, st.st_size)
+
+    def _refresh(self):
+        """Re-read the config file if it changed on disk."""
+        stat = self._stat_key()
+        if stat != self._stat:
+            with open(self.path, 'r') as f:
+                self._config = yaml.load(f, Loader=SafeLoader)
+            self._stat = stat
+
+    def snapshot(self) -> dict:
+        """
+        Get the current configuration.
+
+        The returned dict is shared and must be treated as read-only;
+        use commit() to make changes.
+        """
+        with self._lock:
+            self._refresh()
+            return self._config
+
+    def commit(self, mutator):
+        """
+        Apply a change to the configuration and save it.
+
+        The file is only rewritten if the mutator actually changed
+        something, so no-op requests (e.g. deleting a missing symbol)
+        don't touch the disk.
+
+        Args:
+            mutator: Function called with a private copy of the config to
+                modify in place. If it raises, nothing is written.
+
+        Returns:
+            Whatever mutator returned
+        """
+        with self._lock:
+            self._refresh()
+            config = copy.deepcopy(self._config)
+            result = mutator(config)
+            if config != self._config:
+                self._write(config)
+            return result
+
+    def _write(self, config):
+        """
+        Write config via a temporary file and atomic rename.
+
+        The data and the directory entry are fsynced, so after a crash or
+        power loss the file holds either the old or the new config, never
+        a truncated one.
+        """
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+        # Persist the rename itself
+        dir_fd = os.open(self.path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+        # Keep our copy so the next read doesn't re-parse our own write
+        self._config = config
+        self._stat = self._stat_key()
+
+
+store = ConfigStore(CONFIG_FILE)
+
+
+@app.errorhandler(APIError)
+def handle_api_error(error):
+    """Render an APIError as a JSON error response."""
+    return jsonify({'error': error.message}), error.status
+
+
+def _json_body() -> dict:
+    """Get the request body, which must be a JSON object."""
+    data = request.get_json(silent=True, cache=True)
+    if not isinstance(data, dict):
+        raise APIError('Request body must be a JSON object')
+    return data
+
+
+def _int_range(low, high, message):
+    """Build a validator accepting integers in [low, high]."""
+    def validate(value):
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise APIError(message)
+        if value < low or value > high:
+            raise APIError(message)
+        return value
+    return validate
+
+
+def _number(message):
+    """Build a validator accepting any number."""
+    def validate(value):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            raise APIError(message)
+    return validate
+
+
+def _one_of(choices, message):
+    """Build a validator accepting one of a fixed set of values."""
+    def validate(value):
+        if value not in choices:
+            raise APIError(message)
+        return value
+    return validate
+
+
+def _text(message):
+    """Build a validator accepting a string, returned stripped."""
+    def validate(value):
+        if not isinstance(value, str):
+            raise APIError(message)
+        return value.strip()
+    return validate
+
+
+# Raw symbol input -> canonical interned symbol. Tickers are a small,
+# repetitive set, so this avoids rebuilding the same strings per request.
+_SYMBOL_CACHE_MAX = 512
+_symbol_cache = {}
+
+
+def _normalize_symbol(symbol: str) -> str:
+    """Get the canonical (stripped, upper-case, interned) form of a symbol."""
+    normalized = _symbol_cache.get(symbol)
+    if normalized is None:
+        normalized = sys.intern(symbol.strip().upper())
+        if len(_symbol_cache) < _SYMBOL_CACHE_MAX:
+            _symbol_cache[symbol] = normalized
+    return normalized
+
+
+def _validate_symbol(value):
+    """Validate a ticker symbol from request data and normalize it."""
+    if not isinstance(value, str):
+        raise APIError('Invalid symbol')
+    return _normalize_symbol(value)
+
+
+# Validators are built once at import and shared by all requests
+_validate_zip_code = _text('Invalid ZIP code')
+_validate_url = _text('Invalid url')
+_validate_name = _text('Invalid name')
+_validate_shares = _number('shares must be a number')
+_validate_cost_basis = _number('cost_basis must be a number')
+_validate_max_headlines = _int_range(1, 10, 'Headlines must be 1-10')
+
+# Settings request field -> (config section, config key, validator)
+_SETTINGS_FIELDS = {
+    'refresh_interval': ('refresh', 'interval_minutes', _int_range(1, 60, 'Interval must be 1-60 minutes')),
+    'clock_update_seconds': ('refresh', 'clock_update_seconds', _int_range(10, 300, 'Clock update must be 10-300 seconds')),
+    'weather_units': ('weather', 'units', _one_of(('fahrenheit', 'celsius'), 'Invalid units')),
+    'weather_forecast_days': ('weather', 'show_forecast_days', _int_range(1, 7, 'Forecast days must be 1-7')),
+    'network_show_bandwidth': ('network', 'show_bandwidth', bool),
+    'network_show_devices': ('network', 'show_devices', bool),
+}
 
 
-def save_config(config):
-    """Save configuration to YAML file."""
-    with open(CONFIG_FILE, 'w') as f:
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+def _index_holdings(portfolio) -> dict:
+    """Index a portfolio's holdings by symbol, preserving order."""
+    return {h['symbol']: h for h in portfolio.get('holdings', [])}
+
+
+def _set_portfolio(portfolio, holdings_by_symbol, removed=()):
+    """
+    Write holdings back and keep the symbols list in sync with them.
+
+    Every held symbol is listed in portfolio['symbols']. Symbols in
+    removed are dropped. Other watch-only symbols keep their position.
+
+    Args:
+        portfolio: Portfolio config section to update
+        holdings_by_symbol: Holdings keyed by symbol, in display order
+        removed: Symbols to drop from the symbols list
+    """
+    portfolio['holdings'] = list(holdings_by_symbol.values())
+
+    symbols = [s for s in portfolio.get('symbols', []) if s not in removed]
+    listed = set(symbols)
+    symbols.extend(s for s in holdings_by_symbol if s not in listed)
+    portfolio['symbols'] = symbols
 
 
 @app.route('/')
 def index():
     """Main dashboard page."""
-    config = load_config()
+    config = store.snapshot()
     return render_template('index.html', config=config)
 
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get current configuration."""
-    config = load_config()
+    config = store.snapshot()
     return jsonify(config)
 
 
 @app.route('/api/weather/location', methods=['POST'])
 def update_weather_location():
     """Update weather location."""
-    data = request.json
-    config = load_config()
+    data = _json_body()
 
-    if 'zip_code' in data:
-        zip_code = data['zip_code']
+    if 'zip_code' not in data:
+        raise APIError('Missing zip_code')
 
-        # Validate ZIP
-        if not Geocoder.validate_zip(zip_code):
-            return jsonify({'error': 'Invalid ZIP code'}), 400
+    zip_code = _validate_zip_code(data['zip_code'])
 
-        # Geocode
-        result = Geocoder.zip_to_coords(zip_code)
-        if not result:
-            return jsonify({'error': 'ZIP code not found'}), 404
+    # Validate ZIP
+    if not Geocoder.validate_zip(zip_code):
+        raise APIError('Invalid ZIP code')
 
-        lat, lon, city = result
+    # Geocode (outside the config lock - this is a network call)
+    result = Geocoder.zip_to_coords(zip_code)
+    if not result:
+        raise APIError('ZIP code not found', 404)
 
-        # Update config
+    lat, lon, city = result
+
+    def apply(config):
         config['weather']['zip_code'] = zip_code
         config['weather']['latitude'] = lat
         config['weather']['longitude'] = lon
         config['weather']['location_name'] = city
 
-        save_config(config)
-
-        return jsonify({
-            'success': True,
-            'location': city,
-            'latitude': lat,
-            'longitude': lon
-        })
+    store.commit(apply)
 
-    return jsonify({'error': 'Missing zip_code'}), 400
+    return jsonify({
+        'success': True,
+        'location': city,
+        'latitude': lat,
+        'longitude': lon
+    })
 
 
 @app.route('/api/portfolio/symbols', methods=['GET'])
 def get_portfolio_symbols():
     """Get current portfolio symbols."""
-    config = load_config()
+    config = store.snapshot()
     symbols = config.get('portfolio', {}).get('symbols', [])
     return jsonify({'symbols': symbols})
 
@@ -93,73 +343,69 @@ def get_portfolio_symbols():
 @app.route('/api/portfolio/symbols', methods=['POST'])
 def update_portfolio_symbols():
     """Update portfolio symbols."""
-    data = request.json
-    config = load_config()
+    data = _json_body()
 
-    if 'symbols' in data:
-        symbols = data['symbols']
+    if 'symbols' not in data:
+        raise APIError('Missing symbols')
 
-        # Validate symbols (basic check)
-        if not isinstance(symbols, list):
-            return jsonify({'error': 'symbols must be a list'}), 400
+    symbols = data['symbols']
 
-        # Update config
-        if 'portfolio' not in config:
-            config['portfolio'] = {}
+    # Validate symbols (basic check)
+    if not isinstance(symbols, list):
+        raise APIError('symbols must be a list')
 
-        config['portfolio']['symbols'] = symbols
-        save_config(config)
+    def apply(config):
+        config.setdefault('portfolio', {})['symbols'] = symbols
 
-        return jsonify({'success': True, 'symbols': symbols})
+    store.commit(apply)
 
-    return jsonify({'error': 'Missing symbols'}), 400
+    return jsonify({'success': True, 'symbols': symbols})
 
 
 @app.route('/api/portfolio/symbol', methods=['POST'])
 def add_portfolio_symbol():
     """Add a symbol to portfolio."""
-    data = request.json
-    config = load_config()
+    data = _json_body()
 
-    if 'symbol' in data:
-        symbol = data['symbol'].upper().strip()
+    if 'symbol' not in data:
+        raise APIError('Missing symbol')
 
-        if not symbol:
-            return jsonify({'error': 'Invalid symbol'}), 400
+    symbol = _validate_symbol(data['symbol'])
 
-        # Add to config
-        if 'portfolio' not in config:
-            config['portfolio'] = {}
-        if 'symbols' not in config['portfolio']:
-            config['portfolio']['symbols'] = []
+    if not symbol:
+        raise APIError('Invalid symbol')
 
-        if symbol not in config['portfolio']['symbols']:
-            config['portfolio']['symbols'].append(symbol)
-            save_config(config)
+    def apply(config):
+        symbols = config.setdefault('portfolio', {}).setdefault('symbols', [])
+        if symbol not in symbols:
+            symbols.append(symbol)
+        return symbols
 
-        return jsonify({'success': True, 'symbols': config['portfolio']['symbols']})
+    symbols = store.commit(apply)
 
-    return jsonify({'error': 'Missing symbol'}), 400
+    return jsonify({'success': True, 'symbols': symbols})
 
 
 @app.route('/api/portfolio/symbol/<symbol>', methods=['DELETE'])
 def remove_portfolio_symbol(symbol):
     """Remove a symbol from portfolio."""
-    config = load_config()
-    symbol = symbol.upper().strip()
+    symbol = _normalize_symbol(symbol)
 
-    if 'portfolio' in config and 'symbols' in config['portfolio']:
-        if symbol in config['portfolio']['symbols']:
-            config['portfolio']['symbols'].remove(symbol)
-            save_config(config)
+    def apply(config):
+        portfolio = config.get('portfolio', {})
+        if symbol in portfolio.get('symbols', []):
+            portfolio['symbols'].remove(symbol)
+        return portfolio.get('symbols', [])
 
-    return jsonify({'success': True, 'symbols': config['portfolio'].get('symbols', [])})
+    symbols = store.commit(apply)
+
+    return jsonify({'success': True, 'symbols': symbols})
 
 
 @app.route('/api/portfolio/holdings', methods=['GET'])
 def get_portfolio_holdings():
     """Get current portfolio holdings with shares and cost basis."""
-    config = load_config()
+    config = store.snapshot()
     holdings = config.get('portfolio', {}).get('holdings', [])
     return jsonify({'holdings': holdings})
 
@@ -167,156 +413,114 @@ def get_portfolio_holdings():
 @app.route('/api/portfolio/holdings', methods=['POST'])
 def update_portfolio_holdings():
     """Update all portfolio holdings."""
-    data = request.json
-    config = load_config()
-
-    if 'holdings' in data:
-        holdings = data['holdings']
+    data = _json_body()
 
-        if not isinstance(holdings, list):
-            return jsonify({'error': 'holdings must be a list'}), 400
+    if 'holdings' not in data:
+        raise APIError('Missing holdings')
 
-        # Validate each holding
-        for h in holdings:
-            if 'symbol' not in h:
-                return jsonify({'error': 'Each holding must have a symbol'}), 400
-            h['symbol'] = h['symbol'].upper().strip()
-            h['shares'] = float(h.get('shares', 0))
-            h['cost_basis'] = float(h.get('cost_basis', 0))
+    holdings = data['holdings']
 
-        # Update config
-        if 'portfolio' not in config:
-            config['portfolio'] = {}
+    if not isinstance(holdings, list):
+        raise APIError('holdings must be a list')
 
-        config['portfolio']['holdings'] = holdings
+    # Validate each holding
+    for h in holdings:
+        if not isinstance(h, dict) or 'symbol' not in h:
+            raise APIError('Each holding must have a symbol')
+        h['symbol'] = _validate_symbol(h['symbol'])
+        h['shares'] = _validate_shares(h.get('shares', 0))
+        h['cost_basis'] = _validate_cost_basis(h.get('cost_basis', 0))
 
-        # Also update symbols list to match
-        config['portfolio']['symbols'] = [h['symbol'] for h in holdings]
+    def apply(config):
+        portfolio = config.setdefault('portfolio', {})
 
-        save_config(config)
+        # Replace everything: symbols list ends up matching holdings exactly
+        _set_portfolio(
+            portfolio,
+            {h['symbol']: h for h in holdings},
+            removed=set(portfolio.get('symbols', []))
+        )
 
-        return jsonify({'success': True, 'holdings': holdings})
+    store.commit(apply)
 
-    return jsonify({'error': 'Missing holdings'}), 400
+    return jsonify({'success': True, 'holdings': holdings})
 
 
 @app.route('/api/portfolio/holding', methods=['POST'])
 def add_portfolio_holding():
     """Add or update a single holding."""
-    data = request.json
-    config = load_config()
+    data = _json_body()
 
     if 'symbol' not in data:
-        return jsonify({'error': 'Missing symbol'}), 400
+        raise APIError('Missing symbol')
 
-    symbol = data['symbol'].upper().strip()
-    shares = float(data.get('shares', 0))
-    cost_basis = float(data.get('cost_basis', 0))
+    symbol = _validate_symbol(data['symbol'])
+    shares = _validate_shares(data.get('shares', 0))
+    cost_basis = _validate_cost_basis(data.get('cost_basis', 0))
 
     if not symbol:
-        return jsonify({'error': 'Invalid symbol'}), 400
-
-    # Initialize if needed
-    if 'portfolio' not in config:
-        config['portfolio'] = {}
-    if 'holdings' not in config['portfolio']:
-        config['portfolio']['holdings'] = []
-    if 'symbols' not in config['portfolio']:
-        config['portfolio']['symbols'] = []
+        raise APIError('Invalid symbol')
 
-    # Check if symbol already exists
-    existing = None
-    for i, h in enumerate(config['portfolio']['holdings']):
-        if h['symbol'] == symbol:
-            existing = i
-            break
+    def apply(config):
+        portfolio = config.setdefault('portfolio', {})
 
-    holding = {'symbol': symbol, 'shares': shares, 'cost_basis': cost_basis}
+        # Updating an existing symbol keeps its position
+        holdings_by_symbol = _index_holdings(portfolio)
+        holdings_by_symbol[symbol] = {'symbol': symbol, 'shares': shares, 'cost_basis': cost_basis}
+        _set_portfolio(portfolio, holdings_by_symbol)
 
-    if existing is not None:
-        config['portfolio']['holdings'][existing] = holding
-    else:
-        config['portfolio']['holdings'].append(holding)
-        if symbol not in config['portfolio']['symbols']:
-            config['portfolio']['symbols'].append(symbol)
+        return portfolio['holdings']
 
-    save_config(config)
+    holdings = store.commit(apply)
 
-    return jsonify({'success': True, 'holdings': config['portfolio']['holdings']})
+    return jsonify({'success': True, 'holdings': holdings})
 
 
 @app.route('/api/portfolio/holding/<symbol>', methods=['DELETE'])
 def remove_portfolio_holding(symbol):
     """Remove a holding from portfolio."""
-    config = load_config()
-    symbol = symbol.upper().strip()
+    symbol = _normalize_symbol(symbol)
 
-    if 'portfolio' in config:
-        # Remove from holdings
-        if 'holdings' in config['portfolio']:
-            config['portfolio']['holdings'] = [
-                h for h in config['portfolio']['holdings']
-                if h['symbol'] != symbol
-            ]
+    def apply(config):
+        if 'portfolio' not in config:
+            return []
+        portfolio = config['portfolio']
+
+        holdings_by_symbol = _index_holdings(portfolio)
+        holdings_by_symbol.pop(symbol, None)
+        _set_portfolio(portfolio, holdings_by_symbol, removed={symbol})
 
-        # Remove from symbols
-        if 'symbols' in config['portfolio'] and symbol in config['portfolio']['symbols']:
-            config['portfolio']['symbols'].remove(symbol)
+        return portfolio['holdings']
 
-        save_config(config)
+    holdings = store.commit(apply)
 
-    return jsonify({'success': True, 'holdings': config['portfolio'].get('holdings', [])})
+    return jsonify({'success': True, 'holdings': holdings})
 
 
 @app.route('/api/settings', methods=['POST'])
 def update_settings():
     """Update general settings."""
-    data = request.json
-    config = load_config()
-
-    # Update refresh interval
-    if 'refresh_interval' in data:
-        interval = int(data['refresh_interval'])
-        if interval < 1 or interval > 60:
-            return jsonify({'error': 'Interval must be 1-60 minutes'}), 400
-        config['refresh']['interval_minutes'] = interval
-
-    # Update clock update interval
-    if 'clock_update_seconds' in data:
-        seconds = int(data['clock_update_seconds'])
-        if seconds < 10 or seconds > 300:
-            return jsonify({'error': 'Clock update must be 10-300 seconds'}), 400
-        config['refresh']['clock_update_seconds'] = seconds
-
-    # Update weather units
-    if 'weather_units' in data:
-        units = data['weather_units']
-        if units not in ['fahrenheit', 'celsius']:
-            return jsonify({'error': 'Invalid units'}), 400
-        config['weather']['units'] = units
-
-    # Update weather forecast days
-    if 'weather_forecast_days' in data:
-        days = int(data['weather_forecast_days'])
-        if days < 1 or days > 7:
-            return jsonify({'error': 'Forecast days must be 1-7'}), 400
-        config['weather']['show_forecast_days'] = days
-
-    # Update network settings
-    if 'network_show_bandwidth' in data:
-        config['network']['show_bandwidth'] = bool(data['network_show_bandwidth'])
-
-    if 'network_show_devices' in data:
-        config['network']['show_devices'] = bool(data['network_show_devices'])
-
-    save_config(config)
+    data = _json_body()
+
+    # Validate every field before touching the config
+    updates = [
+        (section, key, validate(data[field]))
+        for field, (section, key, validate) in _SETTINGS_FIELDS.items()
+        if field in data
+    ]
+
+    def apply(config):
+        for section, key, value in updates:
+            config[section][key] = value
+
+    store.commit(apply)
     return jsonify({'success': True})
 
 
 @app.route('/api/news/settings', methods=['GET'])
 def get_news_settings():
     """Get news widget settings."""
-    config = load_config()
+    config = store.snapshot()
     news = config.get('news', {})
     return jsonify({
         'max_headlines': news.get('max_headlines', 5),
@@ -329,37 +533,36 @@ def get_news_settings():
 @app.route('/api/news/settings', methods=['POST'])
 def update_news_settings():
     """Update news widget settings."""
-    data = request.json
-    config = load_config()
+    data = _json_body()
 
-    if 'news' not in config:
-        config['news'] = {}
+    updates = {}
 
     # Update max headlines
     if 'max_headlines' in data:
-        headlines = int(data['max_headlines'])
-        if headlines < 1 or headlines > 10:
-            return jsonify({'error': 'Headlines must be 1-10'}), 400
-        config['news']['max_headlines'] = headlines
+        updates['max_headlines'] = _validate_max_headlines(data['max_headlines'])
 
     # Update single feed (simple mode)
     if 'feed_url' in data:
-        config['news']['feed_url'] = data['feed_url'].strip()
+        updates['feed_url'] = _validate_url(data['feed_url'])
     if 'feed_name' in data:
-        config['news']['feed_name'] = data['feed_name'].strip()
+        updates['feed_name'] = _validate_name(data['feed_name'])
+
+    def apply(config):
+        config.setdefault('news', {}).update(updates)
 
-    save_config(config)
+    store.commit(apply)
     return jsonify({'success': True})
 
 
 @app.route('/api/news/feeds', methods=['GET'])
 def get_news_feeds():
     """Get list of RSS feeds."""
-    config = load_config()
-    feeds = config.get('news', {}).get('feeds', [])
+    config = store.snapshot()
+    news = config.get('news', {})
+    feeds = news.get('feeds', [])
     # Also include the single feed if it exists
-    single_url = config.get('news', {}).get('feed_url')
-    single_name = config.get('news', {}).get('feed_name')
+    single_url = news.get('feed_url')
+    single_name = news.get('feed_name')
     return jsonify({
         'feeds': feeds,
         'single_feed': {'url': single_url, 'name': single_name} if single_url else None
@@ -369,52 +572,51 @@ def get_news_feeds():
 @app.route('/api/news/feed', methods=['POST'])
 def add_news_feed():
     """Add a new RSS feed."""
-    data = request.json
-    config = load_config()
+    data = _json_body()
 
     if 'url' not in data or 'name' not in data:
-        return jsonify({'error': 'Missing url or name'}), 400
+        raise APIError('Missing url or name')
 
-    url = data['url'].strip()
-    name = data['name'].strip()
+    url = _validate_url(data['url'])
+    name = _validate_name(data['name'])
 
     if not url or not name:
-        return jsonify({'error': 'URL and name are required'}), 400
+        raise APIError('URL and name are required')
+
+    def apply(config):
+        feeds = config.setdefault('news', {}).setdefault('feeds', [])
 
-    if 'news' not in config:
-        config['news'] = {}
-    if 'feeds' not in config['news']:
-        config['news']['feeds'] = []
+        # Check for duplicate URL
+        if url in {feed.get('url') for feed in feeds}:
+            raise APIError('Feed URL already exists')
 
-    # Check for duplicate URL
-    for feed in config['news']['feeds']:
-        if feed.get('url') == url:
-            return jsonify({'error': 'Feed URL already exists'}), 400
+        feeds.append({'url': url, 'name': name})
+        return feeds
 
-    config['news']['feeds'].append({'url': url, 'name': name})
-    save_config(config)
+    feeds = store.commit(apply)
 
-    return jsonify({'success': True, 'feeds': config['news']['feeds']})
+    return jsonify({'success': True, 'feeds': feeds})
 
 
 @app.route('/api/news/feed', methods=['DELETE'])
 def remove_news_feed():
     """Remove an RSS feed by URL."""
-    data = request.json
-    config = load_config()
+    data = _json_body()
 
     if 'url' not in data:
-        return jsonify({'error': 'Missing url'}), 400
+        raise APIError('Missing url')
 
-    url = data['url'].strip()
+    url = _validate_url(data['url'])
 
-    if 'news' in config and 'feeds' in config['news']:
-        config['news']['feeds'] = [
-            f for f in config['news']['feeds'] if f.get('url') != url
-        ]
-        save_config(config)
+    def apply(config):
+        news = config.get('news', {})
+        if 'feeds' in news:
+            news['feeds'] = [f for f in news['feeds'] if f.get('url') != url]
+        return news.get('feeds', [])
 
-    return jsonify({'success': True, 'feeds': config['news'].get('feeds', [])})
+    feeds = store.commit(apply)
+
+    return jsonify({'success': True, 'feeds': feeds})
 
 
 def main():
@@ -425,7 +627,19 @@ def main():
     print("Or from another device: http://<pi-ip-address>:5000")
     print("\nPress Ctrl+C to stop\n")
 
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Debugger/reloader only for local development
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(host='0.0.0.0', port=5000, debug=True)
+        return
+
+    try:
+        from waitress import serve
+    except ImportError:
+        print("waitress not installed, falling back to Flask's built-in server")
+        app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
+        return
+
+    serve(app, host='0.0.0.0', port=5000, threads=4)
 
 
 if __name__ == '__main__':
@@ -1,11 +1,15 @@
 """Base widget class for the e-ink dashboard."""
 from abc import ABC, abstractmethod
+from datetime import datetime
 from src.display.renderer import Renderer
 
 
 class Widget(ABC):
     """Base class for all dashboard widgets."""
 
+    # Subclasses that don't declare __slots__ still get a __dict__
+    __slots__ = ('config', 'cache', 'last_update', 'update_interval')
+
     def __init__(self, config, cache=None):
         """
         Initialize widget.
@@ -18,6 +22,9 @@ class Widget(ABC):
         self.cache = cache
         self.last_update = None
 
+        # Minimum seconds between data updates (default: one refresh cycle)
+        self.update_interval = config.get_refresh_interval()
+
     @abstractmethod
     def render(self, renderer: Renderer, bounds: tuple) -> None:
         """
@@ -56,5 +63,5 @@ class Widget(ABC):
         if force or self.last_update is None:
             return True
 
-        # Default: update every refresh cycle
-        return True
+        elapsed = (datetime.now() - self.last_update).total_seconds()
+        return elapsed >= self.update_interval
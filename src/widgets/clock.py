@@ -7,25 +7,52 @@ from src.display.renderer import Renderer
 class ClockWidget(Widget):
     """Displays current time and date."""
 
+    TIME_FORMAT = "%I:%M %p"
+    DATE_FORMAT = "%A, %B %d"
+
     def __init__(self, config, cache=None):
         super().__init__(config, cache)
         self.current_time = None
         self.current_date = None
+        self.update_interval = config.get('refresh.clock_update_seconds', 60)
+
+        # Minute/day the current strings were formatted for
+        self._cached_minute = None
+        self._cached_day = None
+
+        # Layout for the last bounds rendered into
+        self._last_bounds = None
+        self._layout = None
 
     def update_data(self) -> bool:
-        """Update time and date."""
+        """
+        Update time and date.
+
+        Returns:
+            True if the displayed time or date changed
+        """
         now = datetime.now()
-        self.current_time = now.strftime("%I:%M %p").lstrip('0')
-        self.current_date = now.strftime("%A, %B %d")
         self.last_update = now
-        return True
+        changed = False
 
-    def render(self, renderer: Renderer, bounds: tuple) -> None:
-        """Render clock widget."""
-        x, y, width, height = bounds
+        # Time text only changes once a minute, date text once a day
+        minute_key = now.replace(second=0, microsecond=0)
+        if minute_key != self._cached_minute:
+            self.current_time = now.strftime(self.TIME_FORMAT).lstrip('0')
+            self._cached_minute = minute_key
+            changed = True
 
-        if self.current_time is None:
-            self.update_data()
+        today = now.date()
+        if today != self._cached_day:
+            self.current_date = now.strftime(self.DATE_FORMAT)
+            self._cached_day = today
+            changed = True
+
+        return changed
+
+    def _compute_layout(self, bounds: tuple) -> tuple:
+        """Compute (center_x, time_y, date_y, time_font, date_font) for bounds."""
+        x, y, width, height = bounds
 
         # Adjust font sizes based on available height
         # For half-screen (61px), use smaller fonts to prevent overlap
@@ -36,11 +63,28 @@ class ClockWidget(Widget):
             time_font = 20
             date_font = 11
 
-        # Draw time centered in upper portion of bounds
+        # Time in upper third, date in lower third of bounds
+        center_x = x + width // 2
         time_y = y + height // 3
+        date_y = y + 2 * height // 3
+
+        return (center_x, time_y, date_y, time_font, date_font)
+
+    def render(self, renderer: Renderer, bounds: tuple) -> None:
+        """Render clock widget."""
+        if self.current_time is None:
+            self.update_data()
+
+        # Bounds rarely change, so reuse the layout from the last render
+        if bounds != self._last_bounds:
+            self._layout = self._compute_layout(bounds)
+            self._last_bounds = bounds
+        center_x, time_y, date_y, time_font, date_font = self._layout
+
+        # Draw time centered in upper portion of bounds
         renderer.draw_text(
             self.current_time,
-            x + width // 2,
+            center_x,
             time_y,
             font_size=time_font,
             bold=True,
@@ -48,10 +92,9 @@ class ClockWidget(Widget):
         )
 
         # Draw date centered in lower portion of bounds
-        date_y = y + 2 * height // 3
         renderer.draw_text(
             self.current_date,
-            x + width // 2,
+            center_x,
             date_y,
             font_size=date_font,
             bold=False,
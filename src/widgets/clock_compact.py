@@ -12,35 +12,63 @@ class ClockCompactWidget(Widget):
         self.show_seconds = config.get('clock.show_seconds', False)
         self.time_format = config.get('clock.format', '12h')
 
+        # Resolve strftime formats once; they're fixed for the widget's lifetime
+        self._is_24h = self.time_format == '24h'
+        self._time_fmt = '%H:%M' if self._is_24h else '%I:%M %p'
+        self._date_fmt = '%a, %b %d'
+
+        # Formatted strings, reused until the minute/day changes
+        self._cached_minute = None
+        self._cached_day = None
+        self._time_str = None
+        self._date_str = None
+
+        # Layout for the last bounds rendered into
+        self._last_bounds = None
+        self._layout = None
+
     def update_data(self) -> bool:
         """Clock always has current data."""
         self.last_update = datetime.now()
         return True
 
+    def _format_time(self, now: datetime) -> str:
+        """Format the time using the configured 12h/24h format."""
+        time_str = now.strftime(self._time_fmt)
+        if self._is_24h:
+            return time_str
+        # Strip leading zero from 12-hour times ("09:30 AM" -> "9:30 AM")
+        return time_str.lstrip('0')
+
     def render(self, renderer: Renderer, bounds: tuple) -> None:
         """Render compact clock in quadrant bounds."""
-        x, y, width, height = bounds
-
         now = datetime.now()
 
-        # Format time
-        if self.time_format == '24h':
-            time_str = now.strftime('%H:%M')
-        else:
-            time_str = now.strftime('%I:%M %p').lstrip('0')
-
-        # Format date
-        date_str = now.strftime('%a, %b %d')
+        # Format time and date (only when they actually change)
+        minute_key = now.replace(second=0, microsecond=0)
+        if minute_key != self._cached_minute:
+            self._time_str = self._format_time(now)
+            self._cached_minute = minute_key
+        if now.date() != self._cached_day:
+            self._date_str = now.strftime(self._date_fmt)
+            self._cached_day = now.date()
+        time_str = self._time_str
+        date_str = self._date_str
 
-        # Center in quadrant
-        center_x = x + width // 2
-        center_y = y + height // 2
+        # Center in quadrant (bounds rarely change, so reuse the last layout)
+        if bounds != self._last_bounds:
+            x, y, width, height = bounds
+            center_x = x + width // 2
+            center_y = y + height // 2
+            self._layout = (center_x, center_y - 8, center_y + 12)
+            self._last_bounds = bounds
+        center_x, time_y, date_y = self._layout
 
         # Draw time (larger)
         renderer.draw_text(
             time_str,
             center_x,
-            center_y - 8,
+            time_y,
             font_size=14,
             bold=True,
             anchor="mm"
@@ -50,7 +78,7 @@ class ClockCompactWidget(Widget):
         renderer.draw_text(
             date_str,
             center_x,
-            center_y + 12,
+            date_y,
             font_size=9,
             anchor="mm"
         )
@@ -1,15 +1,59 @@
 """Network monitor widget for tracking network statistics."""
+import logging
+import threading
 import time
 import psutil
 from datetime import datetime
+from operator import itemgetter
+from types import SimpleNamespace
 from typing import Dict, Optional
 from .base import Widget
 from src.display.renderer import Renderer
 
+log = logging.getLogger(__name__)
+
+
+class _NetSampler:
+    """Process-wide per-NIC counter snapshot shared by every NetworkWidget."""
+
+    _ttl = 0.5  # Seconds a snapshot is reused
+    _ts = 0.0
+    _pernic = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def sample(cls) -> Dict:
+        """Return psutil.net_io_counters(pernic=True), re-read at most every _ttl seconds."""
+        with cls._lock:
+            now = time.monotonic()
+            if cls._pernic is None or now - cls._ts > cls._ttl:
+                cls._pernic = psutil.net_io_counters(pernic=True)
+                cls._ts = now
+            return cls._pernic
+
 
 class NetworkWidget(Widget):
     """Displays network statistics and bandwidth usage."""
 
+    __slots__ = (
+        'show_bandwidth', 'show_devices', 'interface',
+        'bytes_sent', 'bytes_recv', 'speed_up', 'speed_down',
+        'connections', 'interface_name',
+        'last_bytes_sent', 'last_bytes_recv', 'last_check_time',
+        '_conn_count_ts', '_conn_count_ttl', '_min_interval',
+        '_active_set', '_active_set_ts',
+        '_active_iface_cache', '_active_iface_ts', '_active_iface_ttl',
+        '_fmt_key', '_fmt_strings',
+    )
+
+    # Interfaces never considered for auto-detection
+    _LOOPBACK = frozenset(('lo', 'lo0'))
+    _VIRTUAL_PREFIXES = ('docker', 'veth', 'br-')
+    _IF_STATS_TTL = 60  # Seconds between net_if_stats() refreshes
+
+    # (shift, suffix, decimals) for B, KB, MB, GB
+    _BYTE_UNITS = ((0, 'B', 0), (10, 'KB', 1), (20, 'MB', 1), (30, 'GB', 2))
+
     def __init__(self, config, cache=None):
         super().__init__(config, cache)
         self.show_bandwidth = config.get('network.show_bandwidth', True)
@@ -29,32 +73,67 @@ class NetworkWidget(Widget):
         self.last_bytes_recv = 0
         self.last_check_time = None
 
+        # Connection counting walks every socket; refresh it less often
+        self._conn_count_ts = 0
+        self._conn_count_ttl = config.get('network.connections_ttl', 20)
+
+        # Calls closer together than this reuse the previous sample; shorter
+        # windows would also give noisy bandwidth rates
+        self._min_interval = config.get('network.min_interval', 0.5)
+
+        # Up interfaces from net_if_stats(), refreshed periodically
+        self._active_set = frozenset()
+        self._active_set_ts = 0
+
+        # Last auto-detected interface and when it was chosen
+        self._active_iface_cache = None
+        self._active_iface_ts = 0
+        self._active_iface_ttl = 60
+
+        # Formatted (up, down, sent, recv) strings, keyed by the raw values
+        self._fmt_key = None
+        self._fmt_strings = None
+
     def update_data(self) -> bool:
         """Fetch current network statistics."""
+        if self.last_check_time and time.time() - self.last_check_time < self._min_interval:
+            return True
+
         try:
-            # Get network I/O counters
+            # One pernic read serves both interface selection and stats
+            per_nic = _NetSampler.sample()
             if self.interface:
                 # Specific interface
-                net_io = psutil.net_io_counters(pernic=True)
-                if self.interface in net_io:
-                    stats = net_io[self.interface]
-                    self.interface_name = self.interface
+                if self.interface in per_nic:
+                    name = self.interface
                 else:
-                    print(f"Interface {self.interface} not found, using total")
-                    stats = psutil.net_io_counters()
-                    self.interface_name = "total"
+                    log.warning("Interface %s not found, using total", self.interface)
+                    name = "total"
             else:
-                # Auto-detect active interface or use total
-                stats = psutil.net_io_counters()
-                self.interface_name = self._get_active_interface()
+                # Auto-detect active interface or use total; the choice rarely
+                # changes, so only re-evaluate it every _active_iface_ttl seconds
+                now = time.time()
+                name = self._active_iface_cache
+                if (name is None or (name != "total" and name not in per_nic)
+                        or now - self._active_iface_ts > self._active_iface_ttl):
+                    name = self._get_active_interface(per_nic)
+                    self._active_iface_cache = name
+                    self._active_iface_ts = now
+
+            stats = per_nic.get(name)
+            if stats is None:
+                name = "total"
+                stats = self._sum_counters(per_nic)
+            # Counters from another interface aren't a baseline for this one
+            switched = name != self.interface_name
+            self.interface_name = name
 
             # Calculate speed (bytes per second -> KB/s)
             current_time = time.time()
-            if self.last_check_time:
+            if self.last_check_time and not switched:
                 time_diff = current_time - self.last_check_time
-                if time_diff > 0:
-                    self.speed_up = (stats.bytes_sent - self.last_bytes_sent) / time_diff / 1024
-                    self.speed_down = (stats.bytes_recv - self.last_bytes_recv) / time_diff / 1024
+                self.speed_up = (stats.bytes_sent - self.last_bytes_sent) / time_diff / 1024
+                self.speed_down = (stats.bytes_recv - self.last_bytes_recv) / time_diff / 1024
 
             # Update values
             self.bytes_sent = stats.bytes_sent
@@ -64,48 +143,64 @@ class NetworkWidget(Widget):
             self.last_check_time = current_time
 
             # Get connection count if enabled
-            if self.show_devices:
-                self.connections = len(psutil.net_connections())
+            if self.show_devices and current_time - self._conn_count_ts >= self._conn_count_ttl:
+                self.connections = len(psutil.net_connections(kind='inet'))
+                self._conn_count_ts = current_time
 
             self.last_update = datetime.now()
-            print(f"Network updated: ↑{self.speed_up:.1f} KB/s ↓{self.speed_down:.1f} KB/s")
+            log.debug("Network updated: ↑%.1f KB/s ↓%.1f KB/s", self.speed_up, self.speed_down)
             return True
 
         except Exception as e:
-            print(f"Error fetching network stats: {e}")
+            log.warning("Error fetching network stats: %s", e)
             return False
 
-    def _get_active_interface(self) -> str:
+    def _up_interfaces(self) -> frozenset:
+        """Names of up, non-virtual interfaces; refreshed every _IF_STATS_TTL seconds."""
+        now = time.time()
+        if now - self._active_set_ts >= self._IF_STATS_TTL:
+            try:
+                self._active_set = frozenset(
+                    name for name, stats in psutil.net_if_stats().items()
+                    if stats.isup and name not in self._LOOPBACK
+                    and not name.startswith(self._VIRTUAL_PREFIXES)
+                )
+            except Exception:
+                self._active_set = frozenset()
+            self._active_set_ts = now
+        return self._active_set
+
+    def _get_active_interface(self, per_nic: Dict) -> str:
         """Get the name of the active network interface."""
-        try:
-            # Get per-interface stats
-            net_io = psutil.net_io_counters(pernic=True)
-
-            # Find interface with most traffic (likely the active one)
-            max_bytes = 0
-            active_interface = "total"
-
-            for interface, stats in net_io.items():
-                total_bytes = stats.bytes_sent + stats.bytes_recv
-                if total_bytes > max_bytes and interface not in ['lo', 'lo0']:  # Skip loopback
-                    max_bytes = total_bytes
-                    active_interface = interface
-
-            return active_interface
-
-        except Exception:
-            return "total"
+        candidates = self._up_interfaces().intersection(per_nic)
+        if not candidates:
+            # No link state available; consider everything but loopback
+            candidates = [name for name in per_nic if name not in self._LOOPBACK]
+
+        # Interface with most traffic (likely the active one)
+        best = max(
+            ((per_nic[name].bytes_sent + per_nic[name].bytes_recv, name) for name in candidates),
+            key=itemgetter(0),
+            default=(0, "total"),
+        )
+        return best[1] if best[0] > 0 else "total"
+
+    @staticmethod
+    def _sum_counters(per_nic: Dict) -> SimpleNamespace:
+        """Total sent/received bytes across all interfaces."""
+        return SimpleNamespace(
+            bytes_sent=sum(stats.bytes_sent for stats in per_nic.values()),
+            bytes_recv=sum(stats.bytes_recv for stats in per_nic.values()),
+        )
 
     def _format_bytes(self, bytes_value: int) -> str:
         """Format bytes to human-readable string."""
-        if bytes_value < 1024:
+        # Each unit is 2**10 of the previous, so bit_length picks the row
+        i = min(3, max(0, (int(bytes_value).bit_length() - 1) // 10))
+        shift, suffix, digits = self._BYTE_UNITS[i]
+        if not shift:
             return f"{bytes_value} B"
-        elif bytes_value < 1024 ** 2:
-            return f"{bytes_value / 1024:.1f} KB"
-        elif bytes_value < 1024 ** 3:
-            return f"{bytes_value / (1024 ** 2):.1f} MB"
-        else:
-            return f"{bytes_value / (1024 ** 3):.2f} GB"
+        return f"{bytes_value / (1 << shift):.{digits}f} {suffix}"
 
     def _format_speed(self, kbps: float) -> str:
         """Format speed to human-readable string."""
@@ -116,6 +211,19 @@ class NetworkWidget(Widget):
         else:
             return f"{kbps / 1024:.1f} MB/s"
 
+    def _formatted(self) -> tuple:
+        """Formatted (up, down, sent, recv) strings, reformatted only on change."""
+        key = (self.speed_up, self.speed_down, self.bytes_sent, self.bytes_recv)
+        if key != self._fmt_key:
+            self._fmt_key = key
+            self._fmt_strings = (
+                self._format_speed(self.speed_up),
+                self._format_speed(self.speed_down),
+                self._format_bytes(self.bytes_sent),
+                self._format_bytes(self.bytes_recv),
+            )
+        return self._fmt_strings
+
     def render(self, renderer: Renderer, bounds: tuple) -> None:
         """Render network monitor widget."""
         x, y, width, height = bounds
@@ -140,49 +248,20 @@ class NetworkWidget(Widget):
         start_y = y + 20
 
         if self.show_bandwidth:
-            # Upload speed
-            renderer.draw_text("Upload:", x + 5, start_y, font_size=10, bold=True)
-            speed_up_text = self._format_speed(self.speed_up)
-            renderer.draw_text(
-                speed_up_text,
-                x + width - 5,
-                start_y,
-                font_size=10,
-                anchor="rt"
-            )
-
-            # Download speed
-            renderer.draw_text("Download:", x + 5, start_y + 15, font_size=10, bold=True)
-            speed_down_text = self._format_speed(self.speed_down)
-            renderer.draw_text(
-                speed_down_text,
-                x + width - 5,
-                start_y + 15,
-                font_size=10,
-                anchor="rt"
-            )
-
-            # Total sent
-            renderer.draw_text("Sent:", x + 5, start_y + 32, font_size=9)
-            sent_text = self._format_bytes(self.bytes_sent)
-            renderer.draw_text(
-                sent_text,
-                x + width - 5,
-                start_y + 32,
-                font_size=9,
-                anchor="rt"
-            )
-
-            # Total received
-            renderer.draw_text("Received:", x + 5, start_y + 44, font_size=9)
-            recv_text = self._format_bytes(self.bytes_recv)
-            renderer.draw_text(
-                recv_text,
-                x + width - 5,
-                start_y + 44,
-                font_size=9,
-                anchor="rt"
-            )
+            speed_up_text, speed_down_text, sent_text, recv_text = self._formatted()
+            value_x = x + width - 5
+
+            # Label/value rows share two fonts; draw them in one batch
+            renderer.draw_text_batch((
+                ("Upload:", x + 5, start_y, 10, True, "lt"),
+                (speed_up_text, value_x, start_y, 10, False, "rt"),
+                ("Download:", x + 5, start_y + 15, 10, True, "lt"),
+                (speed_down_text, value_x, start_y + 15, 10, False, "rt"),
+                ("Sent:", x + 5, start_y + 32, 9, False, "lt"),
+                (sent_text, value_x, start_y + 32, 9, False, "rt"),
+                ("Received:", x + 5, start_y + 44, 9, False, "lt"),
+                (recv_text, value_x, start_y + 44, 9, False, "rt"),
+            ))
 
         if self.show_devices:
             # Connection count
@@ -198,26 +277,24 @@ class NetworkWidget(Widget):
         start_y = y + 18
 
         if self.show_bandwidth:
+            speed_up_text, speed_down_text, sent_text, recv_text = self._formatted()
+
             # Upload (with arrow)
             upload_label = "↑"
             renderer.draw_text(upload_label, x + 5, start_y, font_size=10, bold=True)
-            speed_up_text = self._format_speed(self.speed_up)
             renderer.draw_text(speed_up_text, x + 20, start_y, font_size=10)
 
             # Download (with arrow)
             download_label = "↓"
             mid_x = x + width // 2 + 10
             renderer.draw_text(download_label, mid_x, start_y, font_size=10, bold=True)
-            speed_down_text = self._format_speed(self.speed_down)
             renderer.draw_text(speed_down_text, mid_x + 15, start_y, font_size=10)
 
             # Totals on second line
-            sent_text = f"Sent: {self._format_bytes(self.bytes_sent)}"
-            renderer.draw_text(sent_text, x + 5, start_y + 15, font_size=8)
+            renderer.draw_text(f"Sent: {sent_text}", x + 5, start_y + 15, font_size=8)
 
-            recv_text = f"Recv: {self._format_bytes(self.bytes_recv)}"
             renderer.draw_text(
-                recv_text,
+                f"Recv: {recv_text}",
                 x + width - 5,
                 start_y + 15,
                 font_size=8,
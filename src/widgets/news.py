@@ -1,29 +1,114 @@
 """News widget using RSS feeds."""
+import logging
+import re
+import sys
+import textwrap
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from datetime import datetime
-from typing import Optional, List, Tuple
+from itertools import chain, islice, zip_longest
+from typing import Dict, Optional, List, Tuple
 from .base import Widget
 from src.display.renderer import Renderer
 
+log = logging.getLogger(__name__)
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Feeds are untrusted input: prefer parsers that don't expand entities
+try:
+    from lxml import etree as _lxml_etree
+
+    def _iterparse(source, tags):
+        # libxml2 filters on tag, so only matching elements reach Python
+        return _lxml_etree.iterparse(
+            source, events=('end',), tag=tags,
+            resolve_entities=False, no_network=True, huge_tree=False
+        )
+
+    _XML_ERRORS = (_lxml_etree.XMLSyntaxError, ET.ParseError)
+except ImportError:
+    try:
+        from defusedxml.ElementTree import iterparse as _defused_iterparse
+
+        def _iterparse(source, tags):
+            return _defused_iterparse(source, events=('end',))
+    except ImportError:
+        def _iterparse(source, tags):
+            return ET.iterparse(source, events=('end',))
+
+    _XML_ERRORS = (ET.ParseError,)
+
+
+class _LimitedReader:
+    """File-like wrapper that refuses to read past a byte limit."""
+
+    __slots__ = ('_raw', '_remaining')
+
+    def __init__(self, raw, limit: int):
+        self._raw = raw
+        self._remaining = limit
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size if size and size > 0 else 65536)
+        self._remaining -= len(data)
+        if self._remaining < 0:
+            raise ValueError("feed exceeds size limit")
+        return data
+
 
 class NewsWidget(Widget):
     """News widget displaying headlines from RSS feeds."""
 
+    __slots__ = (
+        'feed_url', 'feed_name', 'feeds', 'max_headlines',
+        'headlines', 'rotation_index',
+        'current_page', 'headlines_per_page',
+        'selected_article_index', 'article_scroll_offset',
+        '_title_lines', '_wrap_cache', '_worker', '_fresh',
+    )
+
     # Default RSS feed - BBC World News
     DEFAULT_FEED_URL = 'https://feeds.bbci.co.uk/news/world/rss.xml'
     DEFAULT_FEED_NAME = 'BBC World'
     MAX_CACHED_HEADLINES = 12  # Max headlines to keep (3 pages of 4)
+    REQUEST_TIMEOUT = 15  # Seconds per feed request
+    CACHE_KEY = 'news_headlines'  # APICache entry used for warm starts
+    DETAIL_CHARS_PER_LINE = 30  # Article view wrap width at font_size 10
+    MAX_FEED_BYTES = 2_000_000  # Refuse feeds larger than this (decoded)
+
+    # RSS and Atom tag names, looked up once rather than per item
+    # item tag -> (title tag, description tag); the item's own tag tells us
+    # which vocabulary its children use, so each field needs only one find()
+    _ITEM_FIELDS = {
+        'item': ('title', 'description'),
+        '{http://www.w3.org/2005/Atom}entry': (
+            '{http://www.w3.org/2005/Atom}title',
+            '{http://www.w3.org/2005/Atom}summary',
+        ),
+    }
+    _ITEM_TAGS = frozenset(_ITEM_FIELDS)
 
     def __init__(self, config, cache=None):
         super().__init__(config, cache)
         self.feed_url = config.get('news.feed_url', self.DEFAULT_FEED_URL)
-        self.feed_name = config.get('news.feed_name', self.DEFAULT_FEED_NAME)
+        self.feed_name = sys.intern(config.get('news.feed_name', self.DEFAULT_FEED_NAME))
+        # Configured feed list wins; fall back to the single feed_url/feed_name.
+        # Names are interned: every headline tuple from a feed carries one
+        self.feeds: List[Tuple[str, str]] = [
+            (feed['url'], sys.intern(feed.get('name') or feed['url']))
+            for feed in config.get('news.feeds', None) or []
+            if feed.get('url')
+        ] or [(self.feed_url, self.feed_name)]
+
         self.max_headlines = config.get('news.max_headlines', 5)
         # Headlines now store (title, description, source)
         self.headlines: List[Tuple[str, str, str]] = []
         self.rotation_index = 0  # Current headline to display in widget
-        self._headline_cache: List[Tuple[str, str, str]] = []  # Cache for older headlines
 
         # Pagination for detail view
         self.current_page = 0
@@ -33,45 +118,57 @@ class NewsWidget(Widget):
         self.selected_article_index = -1
         self.article_scroll_offset = 0  # For scrolling long descriptions
 
+        # title -> (compact_lines, full_lines), rebuilt when headlines arrive
+        self._title_lines: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+        # (text, max_chars) -> wrapped lines for the article view
+        self._wrap_cache: Dict[Tuple[str, int], List[str]] = {}
+
+        # Feeds are fetched on a daemon thread shared by every widget showing
+        # the same feeds, so rendering never waits on HTTP
+        self._fresh = threading.Event()
+        self._worker = _feed_worker(self, config.get('news.refresh_seconds', 600))
+
     def rotate(self) -> None:
         """Rotate to the next headline. Called on each clock update."""
-        if self.headlines:
-            self.rotation_index = (self.rotation_index + 1) % len(self.headlines)
-            print(f"[News] Rotated to headline {self.rotation_index + 1}/{len(self.headlines)}")
+        count = len(self.headlines)
+        if count:
+            self.rotation_index = (self.rotation_index + 1) % count
+            log.debug("[News] Rotated to headline %d/%d", self.rotation_index + 1, count)
 
     def get_current_headline(self) -> Optional[Tuple[str, str, str]]:
         """Get the current headline (title, description, source) based on rotation index."""
-        if not self.headlines:
+        headlines = self.headlines
+        if not headlines:
             return None
-        idx = self.rotation_index % len(self.headlines)
-        return self.headlines[idx]
+        return headlines[self.rotation_index % len(headlines)]
 
     def get_headlines_page(self, page: int, per_page: int = 4) -> List[Tuple[str, str, str]]:
         """Get a page of headlines starting from rotation index."""
-        if not self.headlines:
+        headlines = self.headlines
+        n = len(headlines)
+        begin = page * per_page
+        if begin >= n:
             return []
 
-        start_idx = self.rotation_index % len(self.headlines)
-        result = []
-        for i in range(per_page):
-            offset = page * per_page + i
-            if offset < len(self.headlines):
-                idx = (start_idx + offset) % len(self.headlines)
-                result.append(self.headlines[idx])
-        return result
+        # The rotated view wraps at most once, so a page is one or two slices
+        count = min(per_page, n - begin)
+        first = (self.rotation_index + begin) % n
+        if first + count <= n:
+            return headlines[first:first + count]
+        return headlines[first:] + headlines[:first + count - n]
 
     def get_headline_by_index(self, display_index: int) -> Optional[Tuple[str, str, str]]:
         """Get a headline by its display index (relative to rotation)."""
-        if not self.headlines or display_index >= len(self.headlines):
+        headlines = self.headlines
+        if not headlines or display_index >= len(headlines):
             return None
-        start_idx = self.rotation_index % len(self.headlines)
-        actual_idx = (start_idx + display_index) % len(self.headlines)
-        return self.headlines[actual_idx]
+        start_idx = self.rotation_index % len(headlines)
+        actual_idx = (start_idx + display_index) % len(headlines)
+        return headlines[actual_idx]
 
     def get_total_pages(self, per_page: int = 4) -> int:
         """Get total number of pages."""
-        if not self.headlines:
-            return 0
         return (len(self.headlines) + per_page - 1) // per_page
 
     # Navigation methods for detail view
@@ -80,7 +177,7 @@ class NewsWidget(Widget):
         max_page = self.get_total_pages(self.headlines_per_page) - 1
         if self.current_page < max_page:
             self.current_page += 1
-            print(f"[News] Page {self.current_page + 1}/{max_page + 1}")
+            log.debug("[News] Page %d/%d", self.current_page + 1, max_page + 1)
             return True
         return False
 
@@ -89,7 +186,7 @@ class NewsWidget(Widget):
         if self.current_page > 0:
             self.current_page -= 1
             max_page = self.get_total_pages(self.headlines_per_page)
-            print(f"[News] Page {self.current_page + 1}/{max_page}")
+            log.debug("[News] Page %d/%d", self.current_page + 1, max_page)
             return True
         return False
 
@@ -105,11 +202,12 @@ class NewsWidget(Widget):
         """
         # Calculate actual headline index
         actual_index = self.current_page * self.headlines_per_page + tap_index
-        if actual_index < len(self.headlines):
+        headlines = self.headlines
+        if actual_index < len(headlines):
             self.selected_article_index = actual_index
             self.article_scroll_offset = 0
-            title = self.headlines[actual_index][0][:40]
-            print(f"[News] Selected article: {title}...")
+            title = headlines[actual_index][0][:40]
+            log.debug("[News] Selected article: %s...", title)
             return True
         return False
 
@@ -118,7 +216,7 @@ class NewsWidget(Widget):
         if self.selected_article_index >= 0:
             self.selected_article_index = -1
             self.article_scroll_offset = 0
-            print("[News] Closed article detail")
+            log.debug("[News] Closed article detail")
             return True
         return False
 
@@ -171,126 +269,79 @@ class NewsWidget(Widget):
         return None
 
     def update_data(self) -> bool:
-        """Fetch headlines from RSS feed."""
-        print(f"[News] Fetching from {self.feed_url}...")
+        """
+        Report headlines published by the background fetch worker.
 
-        # Skip cache for now to debug
-        result = self._fetch_headlines()
-        if result:
-            self.last_update = datetime.now()
+        Never blocks on the network. Returns True if a new batch has
+        arrived since the previous call.
+        """
+        if self._fresh.is_set():
+            self._fresh.clear()
             return True
         return False
 
-    def _fetch_headlines(self) -> Optional[dict]:
-        """Fetch headlines from RSS feed."""
-        self.headlines = []
-
-        try:
-            print(f"[News] Making request to {self.feed_url}")
-            response = requests.get(
-                self.feed_url,
-                timeout=15,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (compatible; EinkDashboard/1.0)',
-                    'Accept': 'application/rss+xml, application/xml, text/xml'
-                }
-            )
-            print(f"[News] Response status: {response.status_code}")
-            response.raise_for_status()
-
-            # Debug: show first 500 chars of response
-            content = response.content
-            print(f"[News] Response length: {len(content)} bytes")
-            print(f"[News] First 200 chars: {content[:200]}")
-
-            # Parse RSS XML
-            root = ET.fromstring(content)
-            print(f"[News] XML root tag: {root.tag}")
-
-            # Find items - try multiple methods
-            items = root.findall('.//item')
-            print(f"[News] Found {len(items)} items with .//item")
-
-            if not items:
-                items = root.findall('.//{http://www.w3.org/2005/Atom}entry')
-                print(f"[News] Found {len(items)} items with Atom entry")
-
-            if not items:
-                # Debug: list all tags
-                all_tags = set()
-                for elem in root.iter():
-                    all_tags.add(elem.tag)
-                print(f"[News] All tags in XML: {all_tags}")
-
-            for item in items[:self.MAX_CACHED_HEADLINES]:
-                title_elem = item.find('title')
-                if title_elem is None:
-                    title_elem = item.find('{http://www.w3.org/2005/Atom}title')
-
-                # Get description/summary
-                desc_elem = item.find('description')
-                if desc_elem is None:
-                    desc_elem = item.find('{http://www.w3.org/2005/Atom}summary')
-
-                if title_elem is not None and title_elem.text:
-                    title = title_elem.text.strip().replace('\n', ' ')
-                    description = ""
-                    if desc_elem is not None and desc_elem.text:
-                        # Clean up description - remove HTML tags if present
-                        desc_text = desc_elem.text.strip()
-                        # Simple HTML tag removal
-                        import re
-                        description = re.sub(r'<[^>]+>', '', desc_text).strip()
-                        description = description.replace('\n', ' ').replace('  ', ' ')
-
-                    if title:
-                        self.headlines.append((title, description, self.feed_name))
-                        print(f"[News] Added headline: {title[:50]}...")
-
-            print(f"✓ News: Got {len(self.headlines)} headlines from {self.feed_name}")
-
-            # If we got fewer than MAX, fill from cache with non-duplicate headlines
-            if len(self.headlines) < self.MAX_CACHED_HEADLINES and self._headline_cache:
-                existing_titles = {h[0] for h in self.headlines}
-                for cached in self._headline_cache:
-                    if cached[0] not in existing_titles and len(self.headlines) < self.MAX_CACHED_HEADLINES:
-                        self.headlines.append(cached)
-                        existing_titles.add(cached[0])
-                print(f"[News] Filled to {len(self.headlines)} headlines from cache")
-
-            # Update cache with current headlines
-            self._headline_cache = self.headlines.copy()
-
-            # Reset rotation if it's beyond new headline count
-            if self.rotation_index >= len(self.headlines):
-                self.rotation_index = 0
-
-            if self.headlines:
-                return {'headlines': self.headlines}
-            return None
-
-        except requests.exceptions.Timeout:
-            print(f"✗ News: Request timed out for {self.feed_url}")
-            return None
-        except requests.exceptions.RequestException as e:
-            print(f"✗ News: Request failed: {e}")
-            return None
-        except ET.ParseError as e:
-            print(f"✗ News: XML parse error: {e}")
-            return None
-        except Exception as e:
-            print(f"✗ News: Unexpected error: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+    def _publish(self, headlines: List[Tuple[str, str, str]]) -> None:
+        """Precompute layouts for a headline batch and make it current."""
+        # Reset rotation if it's beyond new headline count
+        if self.rotation_index >= len(headlines):
+            self.rotation_index = 0
+
+        # Line splits depend only on the title, so compute them once here
+        self._title_lines = {
+            h[0]: (self._split_compact(h[0]), self._split_full(h[0])) for h in headlines
+        }
+
+        # Pre-wrap the article view text too, so opening an article only draws
+        width = self.DETAIL_CHARS_PER_LINE
+        wrap_cache = {}
+        for title, description, _ in headlines:
+            wrap_cache[(title, width)] = self._wrap_words(title, width)
+            if description:
+                wrap_cache[(description, width)] = self._wrap_words(description, width)
+
+        # Publish with a single assignment; render() may be reading the old list
+        self._wrap_cache = wrap_cache
+        self.headlines = headlines
+
+    @staticmethod
+    def _split_compact(title: str) -> Tuple[str, ...]:
+        """Wrap a title onto at most two ~20-char lines for the quadrant view."""
+        return tuple(textwrap.wrap(title, width=20, max_lines=2, placeholder='...')) or (title,)
+
+    @staticmethod
+    def _split_full(title: str) -> Tuple[str, ...]:
+        """Split a title into 1-2 lines for the full-screen headline list."""
+        # ~30 chars per line at font_size 10
+        chars_per_line = 32
+
+        if len(title) <= chars_per_line:
+            return (title,)
+
+        # Split into 2 lines at word boundary
+        split_point = title.rfind(' ', 0, chars_per_line)
+        if split_point < chars_per_line // 2:
+            split_point = chars_per_line  # Force split if no good word boundary
+
+        line1 = title[:split_point].strip()
+        line2 = title[split_point:].strip()
+
+        # Truncate line2 if still too long
+        if len(line2) > chars_per_line - 2:
+            line2 = line2[:chars_per_line - 5] + "..."
+
+        return (line1, line2)
+
+    def _layout_for(self, title: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """(compact_lines, full_lines) for a title, precomputed at fetch time."""
+        layout = self._title_lines.get(title)
+        if layout is None:
+            layout = (self._split_compact(title), self._split_full(title))
+        return layout
 
     def render(self, renderer: Renderer, bounds: tuple) -> None:
         """Render news headlines."""
         x, y, width, height = bounds
 
-        if not self.headlines:
-            self.update_data()
-
         # Check if this is compact (quadrant) or full screen
         is_compact = height < 80
 
@@ -315,28 +366,16 @@ class NewsWidget(Widget):
             anchor="mt"
         )
 
-        if self.headlines:
+        # The fetch worker may swap in a new list mid-render; read it once
+        headlines = self.headlines
+        if headlines:
             # Get headline at current rotation index
-            idx = self.rotation_index % len(self.headlines)
-            title, description, source = self.headlines[idx]
-
-            # Truncate title to fit quadrant (roughly 20 chars per line)
-            max_chars = 40
-            if len(title) > max_chars:
-                title = title[:max_chars-3] + "..."
-
-            # Split into 2 lines if needed
-            if len(title) > 20:
-                mid = len(title) // 2
-                # Find nearest space
-                space_idx = title.rfind(' ', 0, mid + 5)
-                if space_idx > mid - 5:
-                    line1 = title[:space_idx]
-                    line2 = title[space_idx+1:]
-                else:
-                    line1 = title[:20]
-                    line2 = title[20:]
+            idx = self.rotation_index % len(headlines)
+            title, description, source = headlines[idx]
 
+            compact_lines = self._layout_for(title)[0]
+            if len(compact_lines) == 2:
+                line1, line2 = compact_lines
                 renderer.draw_text(
                     line1,
                     center_x,
@@ -353,7 +392,7 @@ class NewsWidget(Widget):
                 )
             else:
                 renderer.draw_text(
-                    title,
+                    compact_lines[0],
                     center_x,
                     center_y + 2,
                     font_size=7,
@@ -370,7 +409,7 @@ class NewsWidget(Widget):
             )
         else:
             renderer.draw_text(
-                "No news",
+                "No news" if self.last_update else "Loading...",
                 center_x,
                 center_y,
                 font_size=8,
@@ -393,8 +432,12 @@ class NewsWidget(Widget):
         """Render paginated list of headlines."""
         x, y, width, height = bounds
 
+        # The fetch worker may swap in a new list mid-render; read it once
+        headlines = self.headlines
+        per_page = self.headlines_per_page
+
         # Title with page indicator
-        total_pages = self.get_total_pages(self.headlines_per_page)
+        total_pages = (len(headlines) + per_page - 1) // per_page
         if total_pages > 1:
             title_text = f"News ({self.current_page + 1}/{total_pages})"
         else:
@@ -408,9 +451,9 @@ class NewsWidget(Widget):
             bold=True
         )
 
-        if not self.headlines:
+        if not headlines:
             renderer.draw_text(
-                "No headlines available",
+                "No headlines available" if self.last_update else "Loading...",
                 x + width // 2,
                 y + height // 2,
                 font_size=10,
@@ -423,69 +466,43 @@ class NewsWidget(Widget):
         block_height = (height - 16) // 4  # ~26px per headline block
 
         # Get headlines for current page
-        start_idx = self.current_page * self.headlines_per_page
-        page_headlines = self.headlines[start_idx:start_idx + self.headlines_per_page]
+        start_idx = self.current_page * per_page
+        page_headlines = headlines[start_idx:start_idx + per_page]
 
+        # Collect every line and draw them in one batch (two fonts in total)
+        ops = []
         for i, (title, description, source) in enumerate(page_headlines):
             block_y = start_y + i * block_height
 
-            # Word wrap title into 2 lines
-            # ~30 chars per line at font_size 10
-            chars_per_line = 32
-
-            if len(title) <= chars_per_line:
+            full_lines = self._layout_for(title)[1]
+            if len(full_lines) == 1:
                 # Single line - center it vertically in block
-                renderer.draw_text(
-                    f"• {title}",
-                    x + 3,
-                    block_y + block_height // 2 - 5,
-                    font_size=10,
-                    anchor="lt"
-                )
+                ops.append((f"• {full_lines[0]}", x + 3, block_y + block_height // 2 - 5, 10, False, "lt"))
             else:
-                # Split into 2 lines at word boundary
-                split_point = title.rfind(' ', 0, chars_per_line)
-                if split_point < chars_per_line // 2:
-                    split_point = chars_per_line  # Force split if no good word boundary
-
-                line1 = title[:split_point].strip()
-                line2 = title[split_point:].strip()
+                line1, line2 = full_lines
+                ops.append((f"• {line1}", x + 3, block_y, 10, False, "lt"))
+                ops.append((f"  {line2}", x + 3, block_y + 12, 10, False, "lt"))
 
-                # Truncate line2 if still too long
-                if len(line2) > chars_per_line - 2:
-                    line2 = line2[:chars_per_line - 5] + "..."
-
-                # Draw both lines
-                renderer.draw_text(
-                    f"• {line1}",
-                    x + 3,
-                    block_y,
-                    font_size=10,
-                    anchor="lt"
-                )
-                renderer.draw_text(
-                    f"  {line2}",
-                    x + 3,
-                    block_y + 12,
-                    font_size=10,
-                    anchor="lt"
-                )
-
-        # Draw page navigation hints at bottom
+        # Page navigation hints at bottom
         if total_pages > 1:
             if self.current_page > 0:
-                renderer.draw_text("↑", x + width // 2 - 15, y + height - 8, font_size=8, anchor="mm")
+                ops.append(("↑", x + width // 2 - 15, y + height - 8, 8, False, "mm"))
             if self.current_page < total_pages - 1:
-                renderer.draw_text("↓", x + width // 2 + 15, y + height - 8, font_size=8, anchor="mm")
+                ops.append(("↓", x + width // 2 + 15, y + height - 8, 8, False, "mm"))
+
+        renderer.draw_text_batch(ops)
 
     def _render_article_detail(self, renderer: Renderer, bounds: tuple) -> None:
         """Render article summary view."""
         x, y, width, height = bounds
 
-        if self.selected_article_index < 0 or self.selected_article_index >= len(self.headlines):
+        # The fetch worker may swap in a new list mid-render; read it once
+        headlines = self.headlines
+        index = self.selected_article_index
+        if index < 0 or index >= len(headlines):
             return
 
-        title, description, source = self.headlines[self.selected_article_index]
+        title, description, source = headlines[index]
 
         # Header with source and back hint
         renderer.draw_text(
@@ -498,7 +515,7 @@ class NewsWidget(Widget):
 
         # Title area (top portion)
         title_y = y + 14
-        chars_per_line = 30  # Same as headline font
+        chars_per_line = self.DETAIL_CHARS_PER_LINE
 
         # Word wrap title
         title_lines = self._wrap_text(title, chars_per_line)
@@ -562,21 +579,276 @@ class NewsWidget(Widget):
         )
 
     def _wrap_text(self, text: str, max_chars: int) -> List[str]:
-        """Wrap text into lines of max_chars length."""
-        words = text.split()
+        """Wrap text into lines of max_chars length (memoized until the next fetch)."""
+        key = (text, max_chars)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = self._wrap_cache[key] = self._wrap_words(text, max_chars)
+        return lines
+
+    @staticmethod
+    def _wrap_words(text: str, max_chars: int) -> List[str]:
+        """Greedy word wrap of text into lines of at most max_chars."""
         lines = []
-        current_line = ""
+        start = 0  # Index of the first word on the current line
+        width = -1  # Current line length; -1 so the first word adds no space
+        words = text.split()
 
-        for word in words:
-            if not current_line:
-                current_line = word
-            elif len(current_line) + 1 + len(word) <= max_chars:
-                current_line += " " + word
-            else:
-                lines.append(current_line)
-                current_line = word
+        # Track line length as an int and join each line once, rather than
+        # growing a string word by word
+        for i, word in enumerate(words):
+            width += 1 + len(word)
+            if width > max_chars and i > start:
+                lines.append(' '.join(words[start:i]))
+                start = i
+                width = len(word)
 
-        if current_line:
-            lines.append(current_line)
+        if start < len(words):
+            lines.append(' '.join(words[start:]))
 
         return lines
+
+
+class _FeedWorker:
+    """
+    Background fetch loop for one feed list, shared by every NewsWidget that
+    shows it, so each feed is requested once per interval and only one thread
+    writes the headline cache.
+    """
+
+    RETRY_MIN = 30  # Seconds before the first retry after a failed fetch
+
+    def __init__(self, feeds: List[Tuple[str, str]], interval: float, cache=None):
+        self.feeds = feeds
+        self.interval = interval
+        self.cache = cache
+        self._subscribers: List[NewsWidget] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        # Keep-alive session so TLS connections survive across polls
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; EinkDashboard/1.0)',
+            'Accept': 'application/rss+xml, application/xml, text/xml',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        adapter = HTTPAdapter(pool_connections=len(feeds), pool_maxsize=len(feeds))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        # Per-feed validators from the last 200 response, for conditional GETs
+        self._feed_meta: Dict[str, dict] = {}
+
+        # Last published batch; also fills gaps when feeds return too few.
+        # Seeded from disk so widgets show headlines before the first fetch
+        self._headline_cache: List[Tuple[str, str, str]] = []
+        if cache:
+            saved = cache.load(NewsWidget.CACHE_KEY)
+            if saved:
+                self._headline_cache = [(t, d, sys.intern(src)) for t, d, src in saved]
+
+        self._thread = threading.Thread(target=self._fetch_loop, name='news-fetch', daemon=True)
+
+    def subscribe(self, widget: 'NewsWidget') -> None:
+        """Register a widget for new batches and hand it the current one."""
+        with self._lock:
+            self._subscribers.append(widget)
+            if self._headline_cache:
+                widget._publish(self._headline_cache)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the fetch loop to exit; it wakes immediately from its wait."""
+        self._stop.set()
+
+    def _fetch_loop(self) -> None:
+        """Refresh headlines every interval, retrying sooner after a failure."""
+        retry = self.RETRY_MIN
+        while not self._stop.is_set():
+            log.debug("[News] Fetching from %d feed(s)...", len(self.feeds))
+            try:
+                ok = self._fetch_headlines() is not None
+            except Exception:
+                log.exception("✗ News: Fetch worker error")
+                ok = False
+
+            if ok:
+                delay, retry = self.interval, self.RETRY_MIN
+            else:
+                # Back off 30s, 60s, 120s... up to the normal interval
+                delay = min(retry, self.interval)
+                retry = min(retry * 2, self.interval)
+                log.debug("[News] Retrying in %ds", delay)
+            self._stop.wait(delay)
+
+    def _fetch_headlines(self) -> Optional[dict]:
+        """Fetch headlines from all configured RSS feeds concurrently."""
+        results = {}
+        ex = ThreadPoolExecutor(max_workers=len(self.feeds))
+        try:
+            futures = {
+                ex.submit(self._fetch_one, url, name): i
+                for i, (url, name) in enumerate(self.feeds)
+            }
+            try:
+                for future in as_completed(futures, timeout=NewsWidget.REQUEST_TIMEOUT + 5):
+                    results[futures[future]] = future.result()
+            except FuturesTimeout:
+                log.warning("✗ News: %d feed(s) did not respond in time", len(futures) - len(results))
+        except Exception as e:
+            log.warning("✗ News: Unexpected error: %s: %s", type(e).__name__, e, exc_info=True)
+            return None
+        finally:
+            # Don't block on stragglers; they finish in the background
+            ex.shutdown(wait=False)
+
+        # Interleave feeds in configured order so one source can't crowd out the rest
+        limit = NewsWidget.MAX_CACHED_HEADLINES
+        per_feed = [results[i] for i in sorted(results)]
+        headlines = list(islice(
+            (h for h in chain.from_iterable(zip_longest(*per_feed)) if h is not None),
+            limit
+        ))
+
+        log.info("✓ News: Got %d headlines from %d feed(s)", len(headlines), len(per_feed))
+
+        # If we got fewer than MAX, fill from cache with non-duplicate headlines
+        remaining = limit - len(headlines)
+        if remaining > 0 and self._headline_cache:
+            existing_titles = {h[0] for h in headlines}
+            fresh = (c for c in self._headline_cache if c[0] not in existing_titles)
+            for cached in islice(fresh, remaining):
+                headlines.append(cached)
+                existing_titles.add(cached[0])
+            log.debug("[News] Filled to %d headlines from cache", len(headlines))
+
+        # Persist for the next start, but only when the batch actually changed
+        if self.cache and headlines and headlines != self._headline_cache:
+            self.cache.store(NewsWidget.CACHE_KEY, headlines)
+
+        # Published lists are never mutated, so every widget can share this one
+        now = datetime.now()
+        with self._lock:
+            self._headline_cache = headlines
+            for widget in self._subscribers:
+                widget._publish(headlines)
+                widget.last_update = now
+                if headlines:
+                    widget._fresh.set()
+
+        if headlines:
+            return {'headlines': headlines}
+        return None
+
+    def _fetch_one(self, feed_url: str, feed_name: str) -> List[Tuple[str, str, str]]:
+        """Fetch and parse a single RSS/Atom feed. Runs on a worker thread."""
+        headlines: List[Tuple[str, str, str]] = []
+
+        response = None
+        try:
+            # Conditional GET: unchanged feeds answer 304 with no body
+            meta = self._feed_meta.get(feed_url)
+            headers = {}
+            if meta:
+                if meta['etag']:
+                    headers['If-None-Match'] = meta['etag']
+                if meta['last_mod']:
+                    headers['If-Modified-Since'] = meta['last_mod']
+
+            log.debug("[News] Making request to %s", feed_url)
+            response = self._session.get(
+                feed_url, timeout=NewsWidget.REQUEST_TIMEOUT, stream=True, headers=headers
+            )
+            log.debug("[News] Response status: %s", response.status_code)
+            if response.status_code == 304 and meta:
+                log.debug("[News] %s not modified, reusing %d headlines", feed_name, len(meta['cached']))
+                return meta['cached']
+            response.raise_for_status()
+            if int(response.headers.get('Content-Length') or 0) > NewsWidget.MAX_FEED_BYTES:
+                raise ValueError("feed exceeds size limit")
+            response.raw.decode_content = True
+
+            # Stream-parse the feed; each item is processed and discarded as it
+            # closes, and we stop reading once we have enough headlines
+            source = _LimitedReader(response.raw, NewsWidget.MAX_FEED_BYTES)
+            for _, item in _iterparse(source, NewsWidget._ITEM_TAGS):
+                # Stdlib/defusedxml parsers yield every element; lxml pre-filters
+                fields = NewsWidget._ITEM_FIELDS.get(item.tag)
+                if fields is None:
+                    continue
+
+                title_tag, desc_tag = fields
+                title_elem = item.find(title_tag)
+                desc_elem = item.find(desc_tag)  # description/summary
+
+                if title_elem is not None and title_elem.text:
+                    # split/join normalises all whitespace runs in one pass
+                    title = ' '.join(title_elem.text.split())
+                    description = ""
+                    if desc_elem is not None and desc_elem.text:
+                        # Clean up description - strip HTML tags, collapse whitespace
+                        description = _WS_RE.sub(' ', _HTML_TAG_RE.sub('', desc_elem.text)).strip()
+
+                    if title:
+                        headlines.append((title, description, feed_name))
+                        log.debug("[News] Added headline: %.50s...", title)
+
+                item.clear()
+                if len(headlines) >= NewsWidget.MAX_CACHED_HEADLINES:
+                    break
+
+            if not headlines:
+                # Not RSS/Atom, or an unexpected vocabulary; say so once rather
+                # than walking the document for diagnostics
+                log.warning("✗ News: No items found in %s", feed_url)
+                return headlines
+            log.info("✓ News: Got %d headlines from %s", len(headlines), feed_name)
+
+            etag = response.headers.get('ETag')
+            last_mod = response.headers.get('Last-Modified')
+            if etag or last_mod:
+                self._feed_meta[feed_url] = {'etag': etag, 'last_mod': last_mod, 'cached': headlines}
+
+        except requests.exceptions.Timeout:
+            log.warning("✗ News: Request timed out for %s", feed_url)
+        except requests.exceptions.RequestException as e:
+            log.warning("✗ News: Request failed: %s", e)
+        except _XML_ERRORS as e:
+            log.warning("✗ News: XML parse error: %s", e)
+        except ValueError as e:
+            # Oversized feed, or entity/DTD use rejected by defusedxml
+            log.warning("✗ News: Rejected feed %s: %s", feed_url, e)
+        finally:
+            if response is not None:
+                response.close()
+
+        return headlines
+
+
+# One worker per distinct feed list, for the life of the process
+_workers: Dict[Tuple[Tuple[str, str], ...], _FeedWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def _feed_worker(widget: NewsWidget, interval: float) -> _FeedWorker:
+    """Subscribe a widget to the shared worker for its feeds, starting it if new."""
+    key = tuple(widget.feeds)
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is None:
+            worker = _workers[key] = _FeedWorker(widget.feeds, interval, widget.cache)
+            worker.subscribe(widget)
+            worker.start()
+        else:
+            worker.subscribe(widget)
+    return worker
+
+
+def stop_news_workers() -> None:
+    """Stop every background feed worker (called on dashboard shutdown)."""
+    with _workers_lock:
+        for worker in _workers.values():
+            worker.stop()
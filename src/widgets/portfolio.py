@@ -1,14 +1,49 @@
 """Portfolio widget for tracking stocks and cryptocurrency."""
-import requests
+import logging
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
 from .base import Widget
 from src.display.renderer import Renderer
+from src.utils.prices import PriceFetcher, is_crypto_symbol
+
+log = logging.getLogger(__name__)
+
+
+# Prebound formatters for price and change text
+_PRICE_SMALL = "${:.4f}".format
+_PRICE_MED = "${:.2f}".format
+_PRICE_BIG = "${:,.0f}".format
+_CHANGE_FMT = "{:+.1f}%".format
+_TITLE_PAGED = "Portfolio ({}/{})".format
+
+
+@lru_cache(maxsize=512)
+def _format_price(price) -> str:
+    """Format a price with precision suited to its magnitude."""
+    if isinstance(price, (int, float)):
+        if price < 1:
+            return _PRICE_SMALL(price)
+        elif price < 100:
+            return _PRICE_MED(price)
+        else:
+            return _PRICE_BIG(price)
+    return str(price)
+
+
+@lru_cache(maxsize=512)
+def _format_change(change_pct: float) -> str:
+    """Format a daily change percentage with its sign."""
+    return _CHANGE_FMT(change_pct)
 
 
 class PortfolioWidget(Widget):
     """Displays stock and cryptocurrency prices."""
 
+    # Seconds to wait before retrying after a failed update, doubling up to the max
+    RETRY_BACKOFF_MIN = 5
+    RETRY_BACKOFF_MAX = 300
+
     def __init__(self, config, cache=None):
         super().__init__(config, cache)
         self.symbols = config.get('portfolio.symbols', [])
@@ -18,146 +53,61 @@ class PortfolioWidget(Widget):
         self.scroll_offset = 0  # For pagination
         self.items_per_page = 4
 
+        # Title and formatted visible rows, rebuilt when holdings or scroll change
+        self._dirty = True
+        self._total_pages = 0
+        self._title_text = "Portfolio"
+        self._rows = []  # (symbol, price_text, change_text or None, shaded)
+
+        # (line_height, row_ys) for the last bounds rendered into
+        self._layout_key = None
+        self._layout = None
+
+        self.fetcher = PriceFetcher(self.finnhub_api_key, cache)
+
+        # After a failed update, skip fetches until _next_retry_at (monotonic)
+        self._next_retry_at = 0.0
+        self._retry_backoff = self.RETRY_BACKOFF_MIN
+
     def update_data(self) -> bool:
         """Fetch current prices for all symbols."""
         if not self.symbols:
             return False
 
-        if self.cache is None:
-            return self._fetch_prices()
-
-        # Cache for 5 minutes (stock data updates frequently)
-        cache_key = f"portfolio_{'_'.join(self.symbols)}"
-        data = self.cache.get(
-            cache_key,
-            ttl_seconds=300,  # 5 minutes
-            fetch_func=self._fetch_prices
-        )
+        # render() retries whenever holdings are empty; without this an
+        # outage would re-run the full request timeout on every frame
+        now = time.monotonic()
+        if now < self._next_retry_at:
+            return False
 
-        if data:
+        self._fetch_prices()
+        if self.holdings:
+            self._retry_backoff = self.RETRY_BACKOFF_MIN
             self.last_update = datetime.now()
             return True
+
+        self._next_retry_at = now + self._retry_backoff
+        log.warning("Portfolio update failed; retrying in %ds", self._retry_backoff)
+        self._retry_backoff = min(self._retry_backoff * 2, self.RETRY_BACKOFF_MAX)
         return False
 
     def _fetch_prices(self) -> dict:
         """Fetch prices for all symbols."""
-        self.holdings = []
-
-        for symbol in self.symbols:
-            try:
-                # Determine if it's crypto or stock
-                if self._is_crypto_symbol(symbol):
-                    data = self._fetch_crypto_price(symbol)
-                else:
-                    data = self._fetch_stock_price(symbol)
-
-                if data:
-                    self.holdings.append(data)
-
-            except Exception as e:
-                print(f"Error fetching {symbol}: {e}")
-                # Add placeholder for failed symbols
-                self.holdings.append((symbol, "--", 0.0, "error"))
-
-        print(f"Portfolio updated: {len(self.holdings)} symbols")
+        # Cached per symbol and shared with the portfolio summary widget
+        quotes = self.fetcher.fetch_many(self.symbols)
+        self.holdings = [
+            (symbol, *quotes[symbol], 'crypto' if is_crypto_symbol(symbol) else 'stock')
+            for symbol in self.symbols if symbol in quotes
+        ]
+        self._dirty = True
+        log.info("Portfolio updated: %d symbols", len(self.holdings))
         return {"holdings": self.holdings}
 
-    def _is_crypto_symbol(self, symbol: str) -> bool:
-        """Check if symbol looks like a crypto ticker."""
-        # Common crypto patterns: BTC-USD, ETH-USD, or just BTC, ETH, etc.
-        crypto_keywords = ['BTC', 'ETH', 'USDT', 'BNB', 'SOL', 'ADA', 'DOGE', 'XRP', 'DOT', 'MATIC']
-        symbol_base = symbol.split('-')[0].upper()
-        return symbol_base in crypto_keywords or '-USD' in symbol.upper()
-
-    def _fetch_crypto_price(self, symbol: str) -> Optional[tuple]:
-        """Fetch crypto price from CoinGecko API (free, no key)."""
-        try:
-            # Parse symbol (e.g., BTC-USD -> bitcoin)
-            symbol_base = symbol.split('-')[0].upper()
-
-            # Map common symbols to CoinGecko IDs
-            coin_map = {
-                'BTC': 'bitcoin',
-                'ETH': 'ethereum',
-                'USDT': 'tether',
-                'BNB': 'binancecoin',
-                'SOL': 'solana',
-                'ADA': 'cardano',
-                'DOGE': 'dogecoin',
-                'XRP': 'ripple',
-                'DOT': 'polkadot',
-                'MATIC': 'matic-network',
-                'AVAX': 'avalanche-2',
-                'LINK': 'chainlink',
-                'UNI': 'uniswap',
-                'ATOM': 'cosmos',
-                'LTC': 'litecoin',
-            }
-
-            coin_id = coin_map.get(symbol_base)
-            if not coin_id:
-                print(f"Unknown crypto symbol: {symbol}")
-                return None
-
-            # CoinGecko free API
-            url = f"https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                'ids': coin_id,
-                'vs_currencies': 'usd',
-                'include_24hr_change': 'true'
-            }
-
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            if coin_id in data:
-                price = data[coin_id]['usd']
-                change_pct = data[coin_id].get('usd_24h_change', 0.0)
-
-                return (symbol, price, change_pct, 'crypto')
-
-        except Exception as e:
-            print(f"Error fetching crypto {symbol}: {e}")
-            return None
-
-    def _fetch_stock_price(self, symbol: str) -> Optional[tuple]:
-        """Fetch stock price using Finnhub API."""
-        if not self.finnhub_api_key:
-            print(f"No Finnhub API key configured for {symbol}")
-            return None
-
-        try:
-            url = "https://finnhub.io/api/v1/quote"
-            params = {
-                'symbol': symbol.upper(),
-                'token': self.finnhub_api_key
-            }
-
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Finnhub returns: c (current), d (change), dp (percent change),
-            # h (high), l (low), o (open), pc (previous close)
-            current_price = data.get('c', 0)
-            change_pct = data.get('dp', 0)  # dp is percent change
-
-            # Check if we got valid data (Finnhub returns 0 for invalid symbols)
-            if current_price == 0:
-                print(f"No data returned for {symbol}")
-                return None
-
-            return (symbol, current_price, change_pct, 'stock')
-
-        except Exception as e:
-            print(f"Error fetching stock {symbol}: {e}")
-            return None
-
     def scroll_up(self):
         """Scroll up in the holdings list."""
         if self.scroll_offset > 0:
             self.scroll_offset -= 1
+            self._dirty = True
             return True
         return False
 
@@ -166,6 +116,7 @@ class PortfolioWidget(Widget):
         max_offset = max(0, len(self.holdings) - self.items_per_page)
         if self.scroll_offset < max_offset:
             self.scroll_offset += 1
+            self._dirty = True
             return True
         return False
 
@@ -187,80 +138,74 @@ class PortfolioWidget(Widget):
             )
             return
 
-        # Title with page indicator
-        total_pages = (len(self.holdings) + self.items_per_page - 1) // self.items_per_page
-        current_page = (self.scroll_offset // self.items_per_page) + 1
-        if total_pages > 1:
-            title_text = f"Portfolio ({current_page}/{total_pages})"
-        else:
-            title_text = "Portfolio"
-        renderer.draw_text(title_text, x + 5, y + 3, font_size=12, bold=True)
-
-        # Calculate layout - larger row height for bigger fonts
-        start_y = y + 18
-        available_height = height - 22
-        line_height = available_height // self.items_per_page
-
-        # Get visible holdings based on scroll offset
-        visible_holdings = self.holdings[self.scroll_offset:self.scroll_offset + self.items_per_page]
+        if self._dirty:
+            self._prepare_rows()
+        renderer.draw_text(self._title_text, x + 5, y + 3, font_size=12, bold=True)
 
-        # Draw each holding with alternating background
-        for i, holding in enumerate(visible_holdings):
-            symbol, price, change_pct, asset_type = holding
-            line_y = start_y + i * line_height
+        line_height, row_ys = self._layout_for(bounds)
 
+        # Draw each holding with alternating background; row backgrounds go
+        # down first, then all row text in one batch (rows do not overlap)
+        items = []
+        for (symbol, price_text, change_text, shaded), line_y in zip(self._rows, row_ys):
             # Alternating row background (light gray for even rows)
-            if (self.scroll_offset + i) % 2 == 0:
+            if shaded:
                 renderer.draw_rectangle(
                     x + 2, line_y - 2,
                     width - 4, line_height - 1,
                     fill=200  # Light gray
                 )
 
-            # Symbol (left column) - larger font
-            renderer.draw_text(
-                symbol,
-                x + 5,
-                line_y + 2,
-                font_size=13,
-                bold=True,
-                anchor="lt"
-            )
-
-            # Price (center column) - larger font
-            if isinstance(price, (int, float)):
-                if price < 1:
-                    price_text = f"${price:.4f}"
-                elif price < 100:
-                    price_text = f"${price:.2f}"
-                else:
-                    price_text = f"${price:,.0f}"
-            else:
-                price_text = str(price)
-
-            renderer.draw_text(
-                price_text,
-                x + 75,
-                line_y + 2,
-                font_size=12,
-                anchor="lt"
-            )
-
-            # Change percentage (right column) - larger font
-            if self.show_change and isinstance(change_pct, (int, float)):
-                change_text = f"{change_pct:+.1f}%"
-
-                renderer.draw_text(
-                    change_text,
-                    x + width - 5,
-                    line_y + 2,
-                    font_size=12,
-                    anchor="rt"
-                )
+            # Symbol (left), price (center) and change percentage (right
+            # column) - larger fonts
+            text_y = line_y + 2
+            items.append((symbol, x + 5, text_y, 13, True, "lt"))
+            items.append((price_text, x + 75, text_y, 12, False, "lt"))
+            if change_text is not None:
+                items.append((change_text, x + width - 5, text_y, 12, False, "rt"))
+        renderer.draw_text_batch(items)
 
         # Show scroll hints if more holdings exist
-        if total_pages > 1:
+        if self._total_pages > 1:
             if self.scroll_offset > 0:
                 renderer.draw_text("▲", x + width - 10, y + 3, font_size=8, anchor="rt")
             if self.scroll_offset + self.items_per_page < len(self.holdings):
                 renderer.draw_text("▼", x + width - 10, y + height - 3, font_size=8, anchor="rb")
+
+    def _layout_for(self, bounds: tuple) -> tuple:
+        """(line_height, row_ys) for bounds, recomputed only when bounds change."""
+        key = (bounds, self.items_per_page)
+        if key != self._layout_key:
+            x, y, width, height = bounds
+            # Calculate layout - larger row height for bigger fonts
+            start_y = y + 18
+            available_height = height - 22
+            line_height = available_height // self.items_per_page
+            row_ys = tuple(start_y + i * line_height for i in range(self.items_per_page))
+            self._layout = (line_height, row_ys)
+            self._layout_key = key
+        return self._layout
+
+    def _prepare_rows(self):
+        """Rebuild the title and formatted visible rows from holdings and scroll offset."""
+        # Title with page indicator
+        total_pages = (len(self.holdings) + self.items_per_page - 1) // self.items_per_page
+        current_page = (self.scroll_offset // self.items_per_page) + 1
+        if total_pages > 1:
+            self._title_text = _TITLE_PAGED(current_page, total_pages)
+        else:
+            self._title_text = "Portfolio"
+        self._total_pages = total_pages
+
+        # Get visible holdings based on scroll offset
+        visible_holdings = self.holdings[self.scroll_offset:self.scroll_offset + self.items_per_page]
+
+        rows = []
+        for i, (symbol, price, change_pct, asset_type) in enumerate(visible_holdings):
+            change_text = None
+            if self.show_change and isinstance(change_pct, (int, float)):
+                change_text = _format_change(change_pct)
+            rows.append((symbol, _format_price(price), change_text,
+                         (self.scroll_offset + i) % 2 == 0))
+        self._rows = rows
+        self._dirty = False
@@ -1,14 +1,22 @@
 """Portfolio summary widget for quadrant display."""
-import requests
+import logging
+import time
 from datetime import datetime
 from typing import Optional, List
 from .base import Widget
 from src.display.renderer import Renderer
+from src.utils.prices import PriceFetcher
+
+log = logging.getLogger(__name__)
 
 
 class PortfolioSummaryWidget(Widget):
     """Compact portfolio summary showing total value and daily change."""
 
+    # Seconds to wait before retrying after a failed update, doubling up to the max
+    RETRY_BACKOFF_MIN = 5
+    RETRY_BACKOFF_MAX = 300
+
     def __init__(self, config, cache=None):
         super().__init__(config, cache)
         self.finnhub_api_key = config.get('portfolio.finnhub_api_key', '')
@@ -20,61 +28,74 @@ class PortfolioSummaryWidget(Widget):
         self.daily_change = 0.0
         self.daily_change_pct = 0.0
 
+        self.fetcher = PriceFetcher(self.finnhub_api_key, cache)
+
+        # After a failed update, skip fetches until _next_retry_at (monotonic)
+        self._next_retry_at = 0.0
+        self._retry_backoff = self.RETRY_BACKOFF_MIN
+
     def update_data(self) -> bool:
         """Fetch prices and calculate portfolio summary."""
         if not self.holdings:
             return False
 
-        if self.cache:
-            cache_key = "portfolio_summary"
-            data = self.cache.get(
-                cache_key,
-                ttl_seconds=300,
-                fetch_func=self._calculate_portfolio
-            )
-            if data:
-                # Restore values from cached data
-                self.total_value = data.get('total_value', 0.0)
-                self.daily_change = data.get('daily_change', 0.0)
-                self.daily_change_pct = data.get('daily_change_pct', 0.0)
-                self.last_update = datetime.now()
-                return True
+        # render() retries while nothing is priced; without this an outage
+        # would re-run every quote request on every frame
+        now = time.monotonic()
+        if now < self._next_retry_at:
             return False
-        return self._calculate_portfolio() is not None
+
+        # Recalculating only hits the network for symbols whose cached
+        # price has gone stale
+        if self._calculate_portfolio() is not None and self.total_value:
+            self._retry_backoff = self.RETRY_BACKOFF_MIN
+            self.last_update = datetime.now()
+            return True
+
+        self._next_retry_at = now + self._retry_backoff
+        log.warning("Portfolio summary update failed; retrying in %ds", self._retry_backoff)
+        self._retry_backoff = min(self._retry_backoff * 2, self.RETRY_BACKOFF_MAX)
+        return False
 
     def _calculate_portfolio(self) -> Optional[dict]:
         """Calculate total portfolio value and daily change."""
-        self.total_value = 0.0
-        self.total_cost = 0.0
-        self.daily_change = 0.0
+        holdings = [
+            holding for holding in self.holdings
+            if holding.get('symbol', '') and holding.get('shares', 0) > 0
+        ]
+        # Prices are cached per symbol (shared with the portfolio widget)
+        quotes = self.fetcher.fetch_many(h['symbol'] for h in holdings)
+
+        # Accumulate in locals and publish the totals together at the end
+        total_value = 0.0
+        total_cost = 0.0
         prev_total = 0.0
-
-        for holding in self.holdings:
-            symbol = holding.get('symbol', '')
-            shares = holding.get('shares', 0)
-            cost_basis = holding.get('cost_basis', 0)
-
-            if not symbol or shares <= 0:
+        for holding in holdings:
+            price_data = quotes.get(holding['symbol'])
+            if not price_data:
                 continue
+            current_price, change_pct = price_data
+            shares = holding['shares']
 
-            # Fetch current price
-            price_data = self._fetch_price(symbol)
-            if price_data:
-                current_price, change_pct = price_data
-
-                # Calculate values
-                current_value = shares * current_price
-                self.total_value += current_value
-                self.total_cost += shares * cost_basis
+            # Calculate values
+            total_value += shares * current_price
+            total_cost += shares * holding.get('cost_basis', 0)
 
-                # Calculate previous value (before today's change)
-                prev_price = current_price / (1 + change_pct / 100) if change_pct != 0 else current_price
-                prev_total += shares * prev_price
+            # Calculate previous value (before today's change)
+            if change_pct:
+                current_price /= 1 + change_pct / 100
+            prev_total += shares * current_price
 
         # Calculate daily change
+        daily_change = daily_change_pct = 0.0
         if prev_total > 0:
-            self.daily_change = self.total_value - prev_total
-            self.daily_change_pct = (self.daily_change / prev_total) * 100
+            daily_change = total_value - prev_total
+            daily_change_pct = (daily_change / prev_total) * 100
+
+        self.total_value = total_value
+        self.total_cost = total_cost
+        self.daily_change = daily_change
+        self.daily_change_pct = daily_change_pct
 
         return {
             'total_value': self.total_value,
@@ -82,78 +103,6 @@ class PortfolioSummaryWidget(Widget):
             'daily_change_pct': self.daily_change_pct
         }
 
-    def _fetch_price(self, symbol: str) -> Optional[tuple]:
-        """Fetch current price and change percent."""
-        # Check if crypto
-        if self._is_crypto(symbol):
-            return self._fetch_crypto_price(symbol)
-        else:
-            return self._fetch_stock_price(symbol)
-
-    def _is_crypto(self, symbol: str) -> bool:
-        """Check if symbol is a cryptocurrency."""
-        crypto_keywords = ['BTC', 'ETH', 'USDT', 'BNB', 'SOL', 'ADA', 'DOGE', 'XRP']
-        symbol_base = symbol.split('-')[0].upper()
-        return symbol_base in crypto_keywords or '-USD' in symbol.upper()
-
-    def _fetch_stock_price(self, symbol: str) -> Optional[tuple]:
-        """Fetch stock price from Finnhub."""
-        if not self.finnhub_api_key:
-            return None
-
-        try:
-            url = "https://finnhub.io/api/v1/quote"
-            params = {'symbol': symbol.upper(), 'token': self.finnhub_api_key}
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            price = data.get('c', 0)
-            change_pct = data.get('dp', 0)
-
-            if price == 0:
-                return None
-
-            return (price, change_pct)
-
-        except Exception as e:
-            print(f"Error fetching {symbol}: {e}")
-            return None
-
-    def _fetch_crypto_price(self, symbol: str) -> Optional[tuple]:
-        """Fetch crypto price from CoinGecko."""
-        try:
-            symbol_base = symbol.split('-')[0].upper()
-            coin_map = {
-                'BTC': 'bitcoin', 'ETH': 'ethereum', 'SOL': 'solana',
-                'ADA': 'cardano', 'DOGE': 'dogecoin', 'XRP': 'ripple'
-            }
-
-            coin_id = coin_map.get(symbol_base)
-            if not coin_id:
-                return None
-
-            url = "https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                'ids': coin_id,
-                'vs_currencies': 'usd',
-                'include_24hr_change': 'true'
-            }
-
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            if coin_id in data:
-                price = data[coin_id]['usd']
-                change_pct = data[coin_id].get('usd_24h_change', 0)
-                return (price, change_pct)
-
-        except Exception as e:
-            print(f"Error fetching crypto {symbol}: {e}")
-
-        return None
-
     def render(self, renderer: Renderer, bounds: tuple) -> None:
         """Render portfolio summary in quadrant bounds."""
         x, y, width, height = bounds
@@ -1,9 +1,17 @@
 """Weather widget using Open-Meteo API."""
-import requests
-from datetime import datetime
+import logging
+from datetime import date, datetime
+from typing import Optional
 from .base import Widget
 from src.display.renderer import Renderer
 from src.utils.geocoding import Geocoder
+from src.utils.weather_api import FETCH_EXECUTOR, fetch_forecast, forecast_cache_key
+
+log = logging.getLogger(__name__)
+
+# Weekday names indexed by date.weekday(); calendar.day_abbr formats each
+# lookup through strftime and the current locale
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 
 
 class WeatherWidget(Widget):
@@ -37,6 +45,12 @@ class WeatherWidget(Widget):
         99: "Heavy Thunderstorm"
     }
 
+    FORECAST_ROW_HEIGHT = 14  # Each forecast day takes two rows
+    MAX_FORECAST_ROWS = 4  # Future days shown in the right pane
+
+    # WMO codes are 0-99, so index a flat table instead of hashing
+    WEATHER_CODES_ARR = tuple(map(WEATHER_CODES.get, range(100), ("Unknown",) * 100))
+
     def __init__(self, config, cache=None):
         super().__init__(config, cache)
 
@@ -46,99 +60,115 @@ class WeatherWidget(Widget):
         self.longitude = config.get('weather.longitude', -74.0060)
         self.location_name = config.get('weather.location_name', None)
 
-        # If ZIP code is provided but no location_name, geocode it
-        if self.zip_code and not self.location_name and Geocoder.validate_zip(self.zip_code):
-            self.set_location_from_zip(self.zip_code)
-
         self.units = config.get('weather.units', 'fahrenheit')
-        # show_forecast_days is number of FUTURE days (excluding today)
+        # show_forecast_days is number of FUTURE days (excluding today),
+        # capped at the rows the right pane can show.
         # We request +1 to include today's hi/lo for left panel
-        self.forecast_days = config.get('weather.show_forecast_days', 4) + 1
+        future_days = min(config.get('weather.show_forecast_days', 4), self.MAX_FORECAST_ROWS)
+        self.forecast_days = future_days + 1
+
+        # Fetch the first forecast in the background (geocoding the ZIP first
+        # if it has no location_name yet); update_data() collects the result
+        geocode_zip = None
+        if self.zip_code and not self.location_name and Geocoder.validate_zip(self.zip_code):
+            geocode_zip = self.zip_code
+        self._startup = FETCH_EXECUTOR.submit(self._locate_and_fetch, geocode_zip)
 
         self.current_temp = None
         self.current_condition = None
         self.forecast = []  # List of (day, high, low, condition) tuples
 
+        # Display strings, reformatted only when data or location changes
+        self._format_texts()
+
+        # Anchor coordinates for the last bounds rendered into
+        self._layout_key = None
+        self._layout = None
+
+        # Forecast column draw calls for the last (bounds, forecast texts)
+        self._forecast_items_key = None
+        self._forecast_items = ()
+
     def update_data(self) -> bool:
         """Fetch weather data from Open-Meteo API."""
-        if self.cache is None:
-            return self._fetch_weather()
-
-        # Cache for 10 minutes
-        cache_key = f"weather_{self.latitude}_{self.longitude}"
-        data = self.cache.get(
-            cache_key,
-            ttl_seconds=600,  # 10 minutes
-            fetch_func=self._fetch_weather
-        )
-
-        if data:
+        startup, self._startup = self._startup, None
+        if startup is not None and not startup.done():
+            # Startup fetch still running; render() collects it when done
+            self._startup = startup
+            return False
+        if startup is not None:
+            location, data = startup.result()
+            if location:
+                self.latitude, self.longitude, self.location_name = location
+                self._format_texts()
+                log.info("Location set to %s (ZIP %s)", self.location_name, self.zip_code)
+        else:
+            # Shared with the compact weather widget, cached for 10 minutes
+            data = fetch_forecast(
+                self.latitude, self.longitude, self.units, self.forecast_days, self.cache
+            )
+        if data and self._parse_weather(data):
             self.last_update = datetime.now()
             return True
         return False
 
-    def _fetch_weather(self) -> dict:
-        """Fetch weather from Open-Meteo API with retry logic."""
-        max_retries = 3
-        retry_delay = 2
-
-        for attempt in range(max_retries):
-            try:
-                # Determine temperature unit
-                temp_unit = 'fahrenheit' if self.units == 'fahrenheit' else 'celsius'
-
-                # Build API URL
-                url = "https://api.open-meteo.com/v1/forecast"
-                params = {
-                    'latitude': self.latitude,
-                    'longitude': self.longitude,
-                    'current': ['temperature_2m', 'weather_code'],
-                    'daily': ['temperature_2m_max', 'temperature_2m_min', 'weather_code'],
-                    'temperature_unit': temp_unit,
-                    'timezone': 'auto',
-                    'forecast_days': self.forecast_days
-                }
-
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-
-                # Parse current weather
-                self.current_temp = round(data['current']['temperature_2m'])
-                weather_code = data['current']['weather_code']
-                self.current_condition = self.WEATHER_CODES.get(weather_code, "Unknown")
-
-                # Parse forecast
-                self.forecast = []
-                daily = data['daily']
-                for i in range(min(self.forecast_days, len(daily['time']))):
-                    date = datetime.fromisoformat(daily['time'][i])
-                    day_name = date.strftime("%a") if i > 0 else "Today"
-                    high = round(daily['temperature_2m_max'][i])
-                    low = round(daily['temperature_2m_min'][i])
-                    code = daily['weather_code'][i]
-                    condition = self.WEATHER_CODES.get(code, "Unknown")
-
-                    self.forecast.append((day_name, high, low, condition))
-
-                print(f"✓ Weather updated: {self.current_temp}° {self.current_condition}")
-                return data
-
-            except requests.exceptions.RequestException as e:
-                print(f"Weather fetch attempt {attempt + 1}/{max_retries} failed: {e}")
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                else:
-                    print(f"✗ Weather fetch failed after {max_retries} attempts")
-                    # Keep existing data if available, don't overwrite with None
-                    return None
-            except Exception as e:
-                print(f"✗ Unexpected error fetching weather: {e}")
-                return None
-
-        return None
+    def _locate_and_fetch(self, zip_code: Optional[str]):
+        """
+        Geocode zip_code if given, then fetch its forecast (startup worker).
+
+        Returns:
+            ((lat, lon, name) or None, forecast payload or None); the
+            configured coordinates are used without a ZIP or if geocoding fails
+        """
+        location = Geocoder.zip_to_coords(zip_code) if zip_code else None
+        latitude, longitude = location[:2] if location else (self.latitude, self.longitude)
+        return location, fetch_forecast(
+            latitude, longitude, self.units, self.forecast_days, self.cache
+        )
+
+    def _parse_weather(self, data: dict) -> bool:
+        """Update current conditions and forecast from an Open-Meteo payload."""
+        try:
+            # Parse current weather
+            current = data['current']
+            describe = self._describe
+            current_temp = round(current['temperature_2m'])
+            current_condition = describe(current['weather_code'])
+
+            # Parse forecast; days are consecutive, so only the first
+            # date needs parsing to name the rest
+            daily = data['daily']
+            days = daily['time'][:self.forecast_days]
+            first_weekday = date.fromisoformat(days[0]).weekday() if days else 0
+            forecast = [
+                (
+                    _DAYS[(first_weekday + i) % 7] if i > 0 else "Today",
+                    round(high),
+                    round(low),
+                    describe(code),
+                )
+                for i, (_, high, low, code) in enumerate(zip(
+                    days,
+                    daily['temperature_2m_max'],
+                    daily['temperature_2m_min'],
+                    daily['weather_code'],
+                ))
+            ]
+        except (KeyError, TypeError, ValueError) as e:
+            # Keep existing data if available, don't overwrite with None
+            log.warning("✗ Unexpected weather data: %s", e)
+            return False
+
+        self.current_temp = current_temp
+        self.current_condition = current_condition
+        self.forecast = forecast
+        self._format_texts()
+        log.debug("Weather updated: %s° %s", current_temp, current_condition)
+        return True
+
+    def _describe(self, code: int) -> str:
+        """Description for a WMO weather code."""
+        return self.WEATHER_CODES_ARR[code] if 0 <= code < 100 else "Unknown"
 
     def set_location_from_zip(self, zip_code: str) -> bool:
         """
@@ -151,27 +181,47 @@ class WeatherWidget(Widget):
             True if successful
         """
         if not Geocoder.validate_zip(zip_code):
-            print(f"Invalid ZIP code: {zip_code}")
+            log.warning("Invalid ZIP code: %s", zip_code)
             return False
 
         result = Geocoder.zip_to_coords(zip_code)
         if result:
+            # Drop a pending startup lookup so it can't override this one
+            self._startup = None
             lat, lon, city = result
             self.latitude = lat
             self.longitude = lon
             self.zip_code = zip_code
             self.location_name = city
+            self._format_texts()
 
             # Clear cache to force refresh
             if self.cache:
-                cache_key = f"weather_{self.latitude}_{self.longitude}"
-                self.cache.clear(cache_key)
+                self.cache.clear(forecast_cache_key(
+                    self.latitude, self.longitude, self.units, self.forecast_days
+                ))
 
-            print(f"Location set to {city} (ZIP {zip_code})")
+            log.info("Location set to %s (ZIP %s)", city, zip_code)
             return True
 
         return False
 
+    def _format_texts(self):
+        """Format the strings render() draws from the current data and location."""
+        unit = "°F" if self.units == 'fahrenheit' else "°C"
+        temp = self.current_temp if self.current_temp is not None else "--"
+        self._temp_text = f"{temp}{unit}"
+        self._location_text = self.location_name[:18] if self.location_name else None
+        self._zip_text = f"ZIP {self.zip_code}" if self.zip_code else None
+
+        forecast = self.forecast
+        self._hilo_text = f"H:{forecast[0][1]}° L:{forecast[0][2]}°" if forecast else None
+        # (day, hi/lo, condition) for the future days that fit the right pane
+        self._forecast_texts = tuple(
+            (day[:3], f"{high}/{low}°", condition[:10])
+            for day, high, low, condition in forecast[1:self.MAX_FORECAST_ROWS + 1]
+        )
+
     def get_location_display(self) -> str:
         """Get location string for display."""
         if self.location_name:
@@ -183,34 +233,51 @@ class WeatherWidget(Widget):
         else:
             return "Weather"  # Generic label instead of coordinates
 
+    def _layout_for(self, bounds: tuple) -> tuple:
+        """
+        Anchor coordinates for bounds, recomputed only when bounds change.
+
+        Returns:
+            (current_x, temp_y, separator_x, forecast_x, forecast_row_ys)
+        """
+        if bounds != self._layout_key:
+            x, y, width, height = bounds
+
+            # Layout: Current weather on left, forecast on right
+            left_width = width // 2
+            forecast_start_y = y + 4
+            row_step = self.FORECAST_ROW_HEIGHT * 2 + 2
+            self._layout = (
+                x + left_width // 2,
+                y + height // 2,
+                x + left_width,
+                x + left_width + 5,
+                tuple(forecast_start_y + i * row_step for i in range(self.MAX_FORECAST_ROWS)),
+            )
+            self._layout_key = bounds
+        return self._layout
+
     def render(self, renderer: Renderer, bounds: tuple) -> None:
         """Render weather widget."""
         x, y, width, height = bounds
 
-        # Ensure data is loaded on first render
-        if self.current_temp is None:
+        # Never fetch while rendering: collect the startup fetch once it has
+        # finished, otherwise draw placeholders until the next update
+        if self.current_temp is None and self._startup is not None and self._startup.done():
             self.update_data()
 
-        # Use temporary display values (don't permanently overwrite None)
-        display_temp = self.current_temp if self.current_temp is not None else "--"
-        display_condition = self.current_condition if self.current_condition is not None else "Unavailable"
-
-        # Determine unit symbol
-        unit = "°F" if self.units == 'fahrenheit' else "°C"
-
-        # Layout: Current weather on left, forecast on right
-        left_width = width // 2
-        right_width = width - left_width
+        # Placeholder until the first forecast arrives
+        if self.current_condition is not None:
+            display_condition = self.current_condition
+        else:
+            display_condition = "Loading..." if self._startup is not None else "Unavailable"
 
-        # Draw current weather (left side)
-        current_x = x + left_width // 2
+        current_x, temp_y, separator_x, forecast_x, row_ys = self._layout_for(bounds)
 
         # Location name (City, State) at top of left pane
-        if self.location_name:
-            # Truncate if too long for display
-            loc_display = self.location_name[:18] if len(self.location_name) > 18 else self.location_name
+        if self._location_text:
             renderer.draw_text(
-                loc_display,
+                self._location_text,
                 current_x,
                 y + 8,
                 font_size=10,
@@ -219,9 +286,9 @@ class WeatherWidget(Widget):
             )
 
         # ZIP code below location name
-        if self.zip_code:
+        if self._zip_text:
             renderer.draw_text(
-                f"ZIP {self.zip_code}",
+                self._zip_text,
                 current_x,
                 y + 20,
                 font_size=8,
@@ -229,10 +296,8 @@ class WeatherWidget(Widget):
             )
 
         # Temperature (large, centered)
-        temp_y = y + height // 2
-        temp_text = f"{display_temp}{unit}"
         renderer.draw_text(
-            temp_text,
+            self._temp_text,
             current_x,
             temp_y,
             font_size=18,
@@ -242,7 +307,7 @@ class WeatherWidget(Widget):
 
         # Condition (below temperature)
         renderer.draw_text(
-            str(display_condition),
+            display_condition,
             current_x,
             temp_y + 18,
             font_size=9,
@@ -250,12 +315,9 @@ class WeatherWidget(Widget):
         )
 
         # Today's Hi/Lo at bottom of left pane
-        if self.forecast:
-            today_high = self.forecast[0][1]
-            today_low = self.forecast[0][2]
-            hilo_text = f"H:{today_high}° L:{today_low}°"
+        if self._hilo_text:
             renderer.draw_text(
-                hilo_text,
+                self._hilo_text,
                 current_x,
                 y + height - 8,
                 font_size=9,
@@ -264,49 +326,24 @@ class WeatherWidget(Widget):
             )
 
         # Draw vertical separator
-        separator_x = x + left_width
         renderer.draw_vertical_line(separator_x, thickness=1)
 
         # Draw forecast (right side) - skip today, show tomorrow onwards
         # 2-row format per day: Row1: Day + Hi/Lo, Row2: Date + Condition
-        if self.forecast and len(self.forecast) > 1:
-            forecast_x = x + left_width + 5
-            forecast_start_y = y + 4
-
-            # Skip today (index 0), show future days
-            future_forecast = self.forecast[1:]
-
-            # 2 rows per day, larger fonts
-            row_height = 14
-
-            for i, (day, high, low, condition) in enumerate(future_forecast[:4]):  # Max 4 days
-                base_y = forecast_start_y + i * (row_height * 2 + 2)
-
-                # Row 1: Day name and Hi/Lo
-                renderer.draw_text(
-                    day[:3],
-                    forecast_x,
-                    base_y,
-                    font_size=12,
-                    bold=True,
-                    anchor="lt"
-                )
-
-                temp_text = f"{high}/{low}°"
-                renderer.draw_text(
-                    temp_text,
-                    forecast_x + 55,
-                    base_y,
-                    font_size=12,
-                    anchor="lt"
-                )
-
-                # Row 2: Condition
-                short_cond = condition[:10] if len(condition) > 10 else condition
-                renderer.draw_text(
-                    short_cond,
-                    forecast_x,
-                    base_y + row_height,
-                    font_size=10,
-                    anchor="lt"
-                )
+        if self._forecast_texts:
+            items_key = (bounds, self._forecast_texts)
+            if items_key != self._forecast_items_key:
+                # 2 rows per day, larger fonts
+                row_height = self.FORECAST_ROW_HEIGHT
+
+                items = []
+                for (day, hilo, condition), base_y in zip(self._forecast_texts, row_ys):
+                    # Row 1: Day name and Hi/Lo
+                    items.append((day, forecast_x, base_y, 12, True, "lt"))
+                    items.append((hilo, forecast_x + 55, base_y, 12, False, "lt"))
+
+                    # Row 2: Condition
+                    items.append((condition, forecast_x, base_y + row_height, 10, False, "lt"))
+                self._forecast_items = tuple(items)
+                self._forecast_items_key = items_key
+            renderer.draw_text_batch(self._forecast_items)
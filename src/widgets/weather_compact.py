@@ -1,9 +1,42 @@
 """Compact weather widget for quadrant display."""
-import requests
+import logging
 from datetime import datetime
 from typing import Optional
 from .base import Widget
+from .weather import WeatherWidget
 from src.display.renderer import Renderer
+from src.utils.geocoding import Geocoder
+from src.utils.weather_api import FETCH_EXECUTOR, fetch_forecast
+
+log = logging.getLogger(__name__)
+
+# WMO weather code to condition text, built once at import
+_CONDITIONS = {
+    0: 'Clear',
+    1: 'Mostly Clear',
+    2: 'Partly Cloudy',
+    3: 'Overcast',
+    45: 'Foggy',
+    48: 'Icy Fog',
+    51: 'Light Drizzle',
+    53: 'Drizzle',
+    55: 'Heavy Drizzle',
+    61: 'Light Rain',
+    63: 'Rain',
+    65: 'Heavy Rain',
+    71: 'Light Snow',
+    73: 'Snow',
+    75: 'Heavy Snow',
+    77: 'Snow Grains',
+    80: 'Light Showers',
+    81: 'Showers',
+    82: 'Heavy Showers',
+    85: 'Light Snow',
+    86: 'Heavy Snow',
+    95: 'Thunderstorm',
+    96: 'Thunderstorm',
+    99: 'Thunderstorm',
+}
 
 
 class WeatherCompactWidget(Widget):
@@ -14,6 +47,10 @@ class WeatherCompactWidget(Widget):
         self.latitude = config.get('weather.latitude', 40.7128)
         self.longitude = config.get('weather.longitude', -74.0060)
         self.units = config.get('weather.units', 'fahrenheit')
+        # Only today is shown, but requesting the same days as the full
+        # weather widget lets both share one cached forecast
+        future_days = min(config.get('weather.show_forecast_days', 4), WeatherWidget.MAX_FORECAST_ROWS)
+        self.forecast_days = future_days + 1
 
         # Weather data
         self.temperature = None
@@ -21,40 +58,37 @@ class WeatherCompactWidget(Widget):
         self.high = None
         self.low = None
         self.weather_code = None
+        self._format_texts()
+
+        # Resolve a configured ZIP the same way the full weather widget does,
+        # so both request the same coordinates (Geocoder caches the lookup).
+        # Geocoding and the first fetch run in the background.
+        zip_code = config.get('weather.zip_code', None)
+        if not (zip_code and not config.get('weather.location_name', None)
+                and Geocoder.validate_zip(zip_code)):
+            zip_code = None
+        self._startup = FETCH_EXECUTOR.submit(self._locate_and_fetch, zip_code)
 
     def update_data(self) -> bool:
         """Fetch current weather data."""
-        if self.cache:
-            cache_key = f"weather_compact_{self.latitude}_{self.longitude}"
-            data = self.cache.get(
-                cache_key,
-                ttl_seconds=600,
-                fetch_func=self._fetch_weather
+        startup, self._startup = self._startup, None
+        if startup is not None and not startup.done():
+            # Startup fetch still running; render() collects it when done
+            self._startup = startup
+            return False
+        if startup is not None:
+            coords, data = startup.result()
+            if coords:
+                self.latitude, self.longitude = coords
+        else:
+            # Shared with the full weather widget, cached for 10 minutes
+            data = fetch_forecast(
+                self.latitude, self.longitude, self.units, self.forecast_days, self.cache
             )
-            if data:
-                self.last_update = datetime.now()
-                return True
+        if not data:
             return False
-        return self._fetch_weather() is not None
 
-    def _fetch_weather(self) -> Optional[dict]:
-        """Fetch weather from Open-Meteo API."""
         try:
-            url = "https://api.open-meteo.com/v1/forecast"
-            params = {
-                'latitude': self.latitude,
-                'longitude': self.longitude,
-                'current': 'temperature_2m,weather_code',
-                'daily': 'temperature_2m_max,temperature_2m_min',
-                'temperature_unit': 'fahrenheit' if self.units == 'fahrenheit' else 'celsius',
-                'timezone': 'auto',
-                'forecast_days': 1
-            }
-
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
             # Extract current conditions
             current = data.get('current', {})
             self.temperature = round(current.get('temperature_2m', 0))
@@ -68,56 +102,58 @@ class WeatherCompactWidget(Widget):
             if daily.get('temperature_2m_min'):
                 self.low = round(daily['temperature_2m_min'][0])
 
-            return data
-
         except Exception as e:
-            print(f"Error fetching weather: {e}")
-            return None
+            log.warning("✗ Unexpected weather data: %s", e)
+            return False
+
+        self._format_texts()
+        self.last_update = datetime.now()
+        log.debug("Compact weather updated: %s° %s", self.temperature, self.condition)
+        return True
+
+    def _locate_and_fetch(self, zip_code: Optional[str]):
+        """
+        Geocode zip_code if given, then fetch its forecast (startup worker).
+
+        Returns:
+            ((lat, lon) or None, forecast payload or None)
+        """
+        location = Geocoder.zip_to_coords(zip_code) if zip_code else None
+        coords = location[:2] if location else None
+        latitude, longitude = coords or (self.latitude, self.longitude)
+        return coords, fetch_forecast(
+            latitude, longitude, self.units, self.forecast_days, self.cache
+        )
+
+    def _format_texts(self):
+        """Format the strings render() draws from the current data."""
+        self._temp_text = f"{self.temperature}°" if self.temperature is not None else "--°"
+        # Truncate long conditions
+        self._condition_text = self.condition[:12] if self.condition else None
+        if self.high is not None and self.low is not None:
+            self._hilo_text = f"H:{self.high} L:{self.low}"
+        else:
+            self._hilo_text = None
 
     def _get_condition(self, code: int) -> str:
         """Convert weather code to condition text."""
-        conditions = {
-            0: 'Clear',
-            1: 'Mostly Clear',
-            2: 'Partly Cloudy',
-            3: 'Overcast',
-            45: 'Foggy',
-            48: 'Icy Fog',
-            51: 'Light Drizzle',
-            53: 'Drizzle',
-            55: 'Heavy Drizzle',
-            61: 'Light Rain',
-            63: 'Rain',
-            65: 'Heavy Rain',
-            71: 'Light Snow',
-            73: 'Snow',
-            75: 'Heavy Snow',
-            77: 'Snow Grains',
-            80: 'Light Showers',
-            81: 'Showers',
-            82: 'Heavy Showers',
-            85: 'Light Snow',
-            86: 'Heavy Snow',
-            95: 'Thunderstorm',
-            96: 'Thunderstorm',
-            99: 'Thunderstorm',
-        }
-        return conditions.get(code, 'Unknown')
+        return _CONDITIONS.get(code, 'Unknown')
 
     def render(self, renderer: Renderer, bounds: tuple) -> None:
         """Render compact weather in quadrant bounds."""
         x, y, width, height = bounds
 
-        if self.temperature is None:
+        # Never fetch while rendering: collect the startup fetch once it has
+        # finished, otherwise draw placeholders until the next update
+        if self.temperature is None and self._startup is not None and self._startup.done():
             self.update_data()
 
         center_x = x + width // 2
         center_y = y + height // 2
 
         # Temperature (large)
-        temp_str = f"{self.temperature}°" if self.temperature is not None else "--°"
         renderer.draw_text(
-            temp_str,
+            self._temp_text,
             center_x,
             center_y - 10,
             font_size=16,
@@ -126,11 +162,9 @@ class WeatherCompactWidget(Widget):
         )
 
         # Condition (small)
-        if self.condition:
-            # Truncate long conditions
-            cond = self.condition[:12] if len(self.condition) > 12 else self.condition
+        if self._condition_text:
             renderer.draw_text(
-                cond,
+                self._condition_text,
                 center_x,
                 center_y + 6,
                 font_size=8,
@@ -138,10 +172,9 @@ class WeatherCompactWidget(Widget):
             )
 
         # High/Low
-        if self.high is not None and self.low is not None:
-            hl_str = f"H:{self.high} L:{self.low}"
+        if self._hilo_text:
             renderer.draw_text(
-                hl_str,
+                self._hilo_text,
                 center_x,
                 center_y + 18,
                 font_size=7,
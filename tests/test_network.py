@@ -0,0 +1,58 @@
+"""Tests for the network widget."""
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from src.utils.config import Config
+from src.widgets.network import NetworkWidget
+
+
+CONFIG_YAML = """
+network:
+  interface: wlan0
+"""
+
+
+def _counters(sent, recv):
+    return SimpleNamespace(bytes_sent=sent, bytes_recv=recv)
+
+
+class NetworkSpeedTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = Path(tmp.name) / "config.yaml"
+        path.write_text(CONFIG_YAML)
+        self.widget = NetworkWidget(Config(path))
+
+    def _sample(self, per_nic, now):
+        with mock.patch('src.widgets.network._NetSampler.sample', return_value=per_nic), \
+                mock.patch('src.widgets.network.time.time', return_value=now):
+            self.assertTrue(self.widget.update_data())
+
+    def test_speed_between_samples(self):
+        self._sample({'wlan0': _counters(0, 0)}, 100.0)
+        self._sample({'wlan0': _counters(2048, 4096)}, 102.0)
+        self.assertEqual(self.widget.speed_up, 1.0)
+        self.assertEqual(self.widget.speed_down, 2.0)
+
+    def test_interface_switch_resets_baseline(self):
+        # wlan0 disappears between samples, so the widget falls back to the
+        # summed total, whose counters are far larger than wlan0's were
+        self._sample({'wlan0': _counters(1000, 1000)}, 100.0)
+        self._sample({'eth0': _counters(10**9, 10**9)}, 102.0)
+        self.assertEqual(self.widget.interface_name, 'total')
+        self.assertEqual(self.widget.speed_up, 0)
+        self.assertEqual(self.widget.speed_down, 0)
+
+        # The next sample on the same counter measures from the new baseline
+        self._sample({'eth0': _counters(10**9 + 1024, 10**9 + 3072)}, 103.0)
+        self.assertEqual(self.widget.speed_up, 1.0)
+        self.assertEqual(self.widget.speed_down, 3.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
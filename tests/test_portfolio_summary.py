@@ -0,0 +1,50 @@
+"""Tests for the portfolio summary widget."""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.display.renderer import Renderer
+from src.utils.config import Config
+from src.widgets.portfolio_summary import PortfolioSummaryWidget
+
+
+CONFIG_YAML = """
+portfolio:
+  holdings:
+    - symbol: AAPL
+      shares: 2
+      cost_basis: 100
+"""
+
+
+class PortfolioSummaryRenderTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = Path(tmp.name) / "config.yaml"
+        path.write_text(CONFIG_YAML)
+        self.widget = PortfolioSummaryWidget(Config(path))
+
+    def test_failed_fetch_is_not_retried_on_every_render(self):
+        renderer = Renderer()
+        with mock.patch.object(self.widget.fetcher, 'fetch_many', return_value={}) as fetch:
+            for _ in range(5):
+                renderer.create_canvas()
+                self.widget.render(renderer, (0, 0, 125, 61))
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_fetch_resumes_after_backoff(self):
+        with mock.patch.object(self.widget.fetcher, 'fetch_many', return_value={}):
+            self.assertFalse(self.widget.update_data())
+        self.widget._next_retry_at = 0.0
+        with mock.patch.object(self.widget.fetcher, 'fetch_many',
+                               return_value={'AAPL': (150.0, 0.0)}):
+            self.assertTrue(self.widget.update_data())
+        self.assertEqual(self.widget.total_value, 300.0)
+        self.assertEqual(self.widget._retry_backoff, self.widget.RETRY_BACKOFF_MIN)
+
+
+if __name__ == '__main__':
+    unittest.main()